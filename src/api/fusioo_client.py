@@ -4,6 +4,12 @@ import requests
 from typing import Optional
 from dotenv import load_dotenv
 
+# orjson decodes large record pages several times faster; stdlib json is the fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 load_dotenv()
 
 # Module version for cache busting
@@ -26,7 +32,7 @@ class FusiooClient:
         url = f"{self.BASE_URL}/{endpoint}"
         response = requests.request(method, url, headers=self.headers, **kwargs)
         response.raise_for_status()
-        return response.json()
+        return json_loads(response.content)
 
     def get_apps(self) -> list:
         """Get all apps in the workspace."""
@@ -1,26 +1,33 @@
 """Streamlit dashboard for BookSpring metrics - Strategic Goals Edition."""
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from zoneinfo import ZoneInfo
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import date, datetime, timedelta
-from collections import Counter
 from dateutil.relativedelta import relativedelta
 import sys
 import os
 from pathlib import Path
+from types import MappingProxyType
+from functools import lru_cache
+import io
 import json
+import math
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import xml.etree.ElementTree as ET
 from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
 
-# Google Sheets imports
-import gspread
-from google.oauth2.service_account import Credentials
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add project root to path (once - Streamlit re-executes this module on every rerun)
+_PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from src.api.fusioo_client import FusiooClient, ACTIVITY_REPORT_APP_ID, LEGACY_DATA_APP_ID, B3_CHILD_FAMILY_APP_ID, EVENTS_APP_ID, PARTNERS_APP_ID
 from src.data.processor import DataProcessor, get_friendly_name, TimeUnit
@@ -48,6 +55,22 @@ LEGACY_FIELD_MAP = {
     "date": "date_of_activity",  # Current data uses date_of_activity, legacy uses date
 }
 
+# Activity types counted as BookSpring in-person events
+_INPERSON_TYPES = frozenset({"Literacy Materials Distribution", "Family Literacy Activity"})
+_INPERSON_RE = re.compile("Literacy Materials Distribution|Family Literacy Activity")
+
+# Partner pill markup for the goal 2 in-person events box
+_INPERSON_PARTNER_TMPL = "<span class='inperson-pill'>%s</span>"
+
+# Event statuses shown in Upcoming Events
+VALID_EVENT_STATUSES = frozenset({"Date decided", "Ready for Delivery", "Completed"})
+
+# Fusioo event fields shown on the Upcoming Events cards
+EVENT_CARD_FIELDS = ('organizationsite_name_1', 'program', 'bookspring_contact')
+
+# Separators used by Fusioo event date ranges ("start to end", "start - end", "start|end")
+EVENT_DATE_RANGE_SEP = r'\s+to\s+|\s+-\s+|\|'
+
 # Fields to copy as-is from legacy data (DataProcessor handles these natively)
 LEGACY_PASSTHROUGH_FIELDS = [
     "children_912_years",
@@ -63,6 +86,12 @@ LEGACY_PASSTHROUGH_FIELDS = [
     "site_name",
 ]
 
+# Legacy field -> normalized field, in copy order (renames come last so they win)
+_LEGACY_FIELD_PAIRS = (
+    tuple((field, field) for field in LEGACY_PASSTHROUGH_FIELDS)
+    + tuple(LEGACY_FIELD_MAP.items())
+)
+
 def parse_financial_value(value) -> float:
     """Parse a financial value, handling accounting format where () indicates negative.
 
@@ -95,1115 +124,157 @@ def parse_financial_value(value) -> float:
         return 0.0
 
 
-# Brand Colors
-COLORS = {
-    "primary": "#1a365d",       # Deep navy blue
-    "primary_light": "#2c5282",
-    "secondary": "#38a169",     # Success green
-    "accent": "#ed8936",        # Warm orange
-    "accent_alt": "#9f7aea",    # Purple
-    "background": "#f7fafc",
-    "surface": "#ffffff",
-    "text": "#1a202c",
-    "text_muted": "#718096",
-    "border": "#e2e8f0",
-    "gradient_start": "#667eea",
-    "gradient_end": "#764ba2",
-}
-
-# Page config
-st.set_page_config(
-    page_title="BookSpring Strategic Dashboard",
-    page_icon="📚",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Modern CSS with glassmorphism, animations, and beautiful styling
-st.markdown("""
-<style>
-    /* ========================================
-       ROOT & GLOBAL STYLES
-       ======================================== */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-
-    :root {
-        --primary: #1a365d;
-        --primary-light: #2c5282;
-        --secondary: #38a169;
-        --accent: #ed8936;
-        --accent-alt: #9f7aea;
-        --surface: #ffffff;
-        --background: #f7fafc;
-        --text: #1a202c;
-        --text-muted: #718096;
-        --border: #e2e8f0;
-        --shadow-sm: 0 1px 2px 0 rgba(0, 0, 0, 0.05);
-        --shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-        --shadow-lg: 0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04);
-        --shadow-xl: 0 25px 50px -12px rgba(0, 0, 0, 0.25);
-        --radius-sm: 8px;
-        --radius: 12px;
-        --radius-lg: 16px;
-        --radius-xl: 24px;
-    }
-
-    * {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
-    }
-
-    /* Clean white background for main area */
-    .stApp {
-        background: linear-gradient(180deg, #f8fafc 0%, #ffffff 100%);
-    }
-
-    .main .block-container {
-        padding: 1.5rem 2rem 3rem 2rem;
-        max-width: 1400px;
-        background: transparent;
-    }
-
-    /* Hide Streamlit branding, toolbar, and manage app button */
-    #MainMenu, footer, [data-testid="stToolbar"], .stDeployButton, [data-testid="manage-app-button"] {visibility: hidden;}
-    .stAppDeployButton, ._container_gzau3_1, [data-testid="stStatusWidget"] {display: none !important;}
-
-    /* Fix sidebar toggle button icon */
-    button[kind="headerNoPadding"] span {
-        font-size: 0 !important;
-    }
-    button[kind="headerNoPadding"] span::before {
-        content: "☰";
-        font-size: 1.5rem;
-        color: #1a365d;
-    }
-    [data-testid="collapsedControl"] {
-        color: #1a365d;
-    }
-    [data-testid="collapsedControl"] svg {
-        display: none;
-    }
-    [data-testid="collapsedControl"]::before {
-        content: "☰";
-        font-size: 1.5rem;
-    }
-
-    /* ========================================
-       HERO HEADER
-       ======================================== */
-    .hero-container {
-        background: linear-gradient(135deg, #1a365d 0%, #2c5282 50%, #38a169 100%);
-        border-radius: var(--radius-xl);
-        padding: 2.5rem 3rem;
-        margin-bottom: 2rem;
-        position: relative;
-        overflow: hidden;
-        box-shadow: var(--shadow-xl);
-    }
-
-    .hero-container::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        right: -20%;
-        width: 60%;
-        height: 200%;
-        background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
-        transform: rotate(-15deg);
-    }
-
-    .hero-container::after {
-        content: '';
-        position: absolute;
-        bottom: -30%;
-        left: -10%;
-        width: 40%;
-        height: 150%;
-        background: radial-gradient(circle, rgba(56,161,105,0.3) 0%, transparent 70%);
-    }
-
-    .hero-content {
-        position: relative;
-        z-index: 1;
-    }
-
-    .hero-title {
-        font-size: 2.5rem;
-        font-weight: 800;
-        color: white;
-        margin: 0 0 0.5rem 0;
-        letter-spacing: -0.02em;
-        text-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-
-    .hero-subtitle {
-        font-size: 1.1rem;
-        color: rgba(255,255,255,0.9);
-        margin: 0;
-        font-weight: 400;
-    }
-
-    .hero-stats {
-        display: flex;
-        gap: 2rem;
-        margin-top: 1.5rem;
-        flex-wrap: wrap;
-    }
-
-    .hero-stat {
-        background: rgba(255,255,255,0.15);
-        backdrop-filter: blur(10px);
-        padding: 1rem 1.5rem;
-        border-radius: var(--radius);
-        border: 1px solid rgba(255,255,255,0.2);
-    }
-
-    .hero-stat-value {
-        font-size: 1.75rem;
-        font-weight: 700;
-        color: white;
-    }
-
-    .hero-stat-label {
-        font-size: 0.85rem;
-        color: rgba(255,255,255,0.8);
-        margin-top: 0.25rem;
-    }
-
-    /* ========================================
-       SECTION HEADERS
-       ======================================== */
-    .section-header {
-        display: flex;
-        align-items: center;
-        gap: 1rem;
-        margin-bottom: 1.5rem;
-        padding: 1.25rem 1.5rem;
-        background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%);
-        border-radius: 12px;
-        border: 1px solid #e2e8f0;
-    }
-
-    .section-icon {
-        width: 48px;
-        height: 48px;
-        border-radius: 10px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.5rem;
-        flex-shrink: 0;
-    }
-
-    .section-icon.goal1 { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
-    .section-icon.goal2 { background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); }
-    .section-icon.goal3 { background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); }
-    .section-icon.goal4 { background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%); }
-    .section-icon.financial { background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); }
-    .section-icon.trends { background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); }
-    .section-icon.compare { background: linear-gradient(135deg, #d299c2 0%, #fef9d7 100%); }
-
-    .section-title-group {
-        flex: 1;
-    }
-
-    .section-title {
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: var(--text);
-        margin: 0;
-        letter-spacing: -0.01em;
-    }
-
-    .section-subtitle {
-        font-size: 0.85rem;
-        color: var(--text-muted);
-        margin: 0.35rem 0 0 0;
-    }
-
-    .section-note {
-        font-size: 0.8rem;
-        color: #64748b;
-        margin: 0.5rem 0 0 0;
-    }
-
-    /* ========================================
-       GOAL CARDS
-       ======================================== */
-    .goal-card {
-        background: var(--surface);
-        border-radius: var(--radius-lg);
-        padding: 1.75rem;
-        margin-bottom: 1.5rem;
-        box-shadow: var(--shadow);
-        border: 1px solid var(--border);
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-
-    .goal-card:hover {
-        box-shadow: var(--shadow-lg);
-        transform: translateY(-2px);
-    }
-
-    .goal-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-    }
-
-    .goal-card.goal1::before { background: linear-gradient(90deg, #667eea, #764ba2); }
-    .goal-card.goal2::before { background: linear-gradient(90deg, #f093fb, #f5576c); }
-    .goal-card.goal3::before { background: linear-gradient(90deg, #4facfe, #00f2fe); }
-    .goal-card.goal4::before { background: linear-gradient(90deg, #43e97b, #38f9d7); }
-
-    /* ========================================
-       METRIC CARDS
-       ======================================== */
-    .metric-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-        gap: 1rem;
-        margin-bottom: 1.5rem;
-    }
-
-    .metric-card {
-        background: linear-gradient(135deg, var(--surface) 0%, #f7fafc 100%);
-        border-radius: var(--radius);
-        padding: 1.25rem 1.5rem;
-        border: 1px solid var(--border);
-        box-shadow: var(--shadow-sm);
-        transition: all 0.2s ease;
-        position: relative;
-        overflow: hidden;
-    }
-
-    .metric-card:hover {
-        box-shadow: var(--shadow);
-        border-color: #cbd5e0;
-    }
-
-    .metric-card::after {
-        content: '';
-        position: absolute;
-        top: 0;
-        right: 0;
-        width: 60px;
-        height: 60px;
-        background: linear-gradient(135deg, transparent 50%, rgba(26,54,93,0.03) 50%);
-    }
-
-    .metric-icon {
-        font-size: 1.5rem;
-        margin-bottom: 0.5rem;
-    }
-
-    .metric-value {
-        font-size: 1.75rem;
-        font-weight: 700;
-        color: var(--text);
-        margin: 0;
-        letter-spacing: -0.02em;
-    }
-
-    .metric-label {
-        font-size: 0.85rem;
-        color: var(--text-muted);
-        margin: 0.25rem 0 0 0;
-        font-weight: 500;
-    }
-
-    .metric-delta {
-        font-size: 0.75rem;
-        font-weight: 600;
-        margin-top: 0.5rem;
-        padding: 0.25rem 0.5rem;
-        border-radius: 4px;
-        display: inline-block;
-    }
-
-    .metric-delta.positive {
-        background: #c6f6d5;
-        color: #22543d;
-    }
-
-    .metric-delta.negative {
-        background: #fed7d7;
-        color: #822727;
-    }
-
-    /* Custom metric box to match Streamlit metrics */
-    .metric-box {
-        background: linear-gradient(135deg, var(--surface) 0%, #f7fafc 100%);
-        border: 1px solid var(--border);
-        border-radius: var(--radius);
-        padding: 1.25rem;
-        box-shadow: var(--shadow-sm);
-        transition: all 0.2s ease;
-    }
-
-    .metric-box:hover {
-        box-shadow: var(--shadow);
-        border-color: #cbd5e0;
-    }
-
-    /* ========================================
-       STREAMLIT METRIC STYLING
-       ======================================== */
-    [data-testid="metric-container"] {
-        background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
-        border: 1px solid #e2e8f0;
-        border-radius: 12px;
-        padding: 1rem 1.25rem;
-        box-shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06);
-        transition: all 0.2s ease;
-    }
-
-    [data-testid="metric-container"]:hover {
-        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-        border-color: #cbd5e0;
-        transform: translateY(-1px);
-    }
-
-    [data-testid="metric-container"] label {
-        font-weight: 600 !important;
-        color: #4a5568 !important;
-        font-size: 0.875rem !important;
-    }
-
-    [data-testid="metric-container"] [data-testid="stMetricValue"] {
-        font-weight: 700 !important;
-        color: #1a202c !important;
-    }
-
-    [data-testid="metric-container"] [data-testid="stMetricDelta"] {
-        font-weight: 600 !important;
-    }
-
-    .metric-box .metric-label {
-        font-size: 0.875rem;
-        color: var(--text-muted);
-        font-weight: 500;
-        margin: 0 0 0.25rem 0;
-    }
-
-    .metric-box .metric-value {
-        font-size: 2rem;
-        font-weight: 700;
-        color: var(--text);
-        margin: 0;
-        letter-spacing: -0.02em;
-    }
-
-    .metric-box .metric-delta {
-        font-size: 0.875rem;
-        color: var(--text-muted);
-        margin: 0.25rem 0 0 0;
-        padding: 0;
-        display: block;
-        background: none;
-    }
-
-    /* Override Streamlit metric containers */
-    div[data-testid="metric-container"] {
-        background: linear-gradient(135deg, var(--surface) 0%, #f7fafc 100%);
-        border: 1px solid var(--border);
-        border-radius: var(--radius);
-        padding: 1.25rem;
-        box-shadow: var(--shadow-sm);
-        transition: all 0.2s ease;
-    }
-
-    div[data-testid="metric-container"]:hover {
-        box-shadow: var(--shadow);
-        border-color: #cbd5e0;
-    }
-
-    div[data-testid="metric-container"] label {
-        color: var(--text-muted) !important;
-        font-weight: 500 !important;
-    }
-
-    div[data-testid="metric-container"] [data-testid="stMetricValue"] {
-        font-weight: 700 !important;
-        color: var(--text) !important;
-    }
-
-    /* ========================================
-       PROGRESS BARS
-       ======================================== */
-    .progress-container {
-        background: var(--border);
-        border-radius: 100px;
-        height: 12px;
-        overflow: hidden;
-        margin: 1rem 0;
-        box-shadow: inset 0 1px 3px rgba(0,0,0,0.1);
-    }
-
-    .progress-bar {
-        height: 100%;
-        border-radius: 100px;
-        transition: width 0.8s cubic-bezier(0.4, 0, 0.2, 1);
-        position: relative;
-        overflow: hidden;
-    }
-
-    .progress-bar::after {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: linear-gradient(
-            90deg,
-            transparent,
-            rgba(255,255,255,0.3),
-            transparent
-        );
-        animation: shimmer 2s infinite;
-    }
-
-    @keyframes shimmer {
-        0% { transform: translateX(-100%); }
-        100% { transform: translateX(100%); }
-    }
-
-    .progress-bar.goal1 { background: linear-gradient(90deg, #667eea, #764ba2); }
-    .progress-bar.goal2 { background: linear-gradient(90deg, #f093fb, #f5576c); }
-    .progress-bar.goal3 { background: linear-gradient(90deg, #4facfe, #00f2fe); }
-    .progress-bar.goal4 { background: linear-gradient(90deg, #43e97b, #38f9d7); }
-
-    .progress-label {
-        display: flex;
-        justify-content: space-between;
-        font-size: 0.85rem;
-        color: var(--text-muted);
-        margin-top: 0.5rem;
-    }
-
-    /* Override Streamlit progress bars */
-    .stProgress > div > div {
-        background: linear-gradient(90deg, #667eea, #764ba2) !important;
-        border-radius: 100px;
-    }
-
-    .stProgress > div {
-        background: var(--border) !important;
-        border-radius: 100px;
-        height: 10px !important;
-    }
-
-    /* ========================================
-       PLACEHOLDER CARDS
-       ======================================== */
-    .placeholder-card {
-        background: linear-gradient(135deg, #f7fafc 0%, #edf2f7 100%);
-        border: 2px dashed #cbd5e0;
-        border-radius: var(--radius-lg);
-        padding: 2rem;
-        text-align: center;
-        position: relative;
-    }
-
-    .placeholder-card h4 {
-        color: var(--primary);
-        font-weight: 600;
-        margin: 0 0 1rem 0;
-        font-size: 1.1rem;
-    }
-
-    .placeholder-card p {
-        color: var(--text-muted);
-        margin: 0;
-        font-size: 0.9rem;
-    }
-
-    .placeholder-card ul {
-        text-align: left;
-        display: inline-block;
-        margin: 1rem 0 0 0;
-        padding-left: 1.5rem;
-        color: var(--text-muted);
-    }
-
-    .placeholder-card li {
-        margin: 0.5rem 0;
-        font-size: 0.9rem;
-    }
+@lru_cache(maxsize=64)
+def format_budget_delta(actual: float, budget: float) -> str:
+    """Format actual vs budget as a signed st.metric delta, e.g. "+$1,234 (5.2%)".
 
-    /* ========================================
-       BUTTONS
-       ======================================== */
-    .stButton > button {
-        background: linear-gradient(135deg, var(--primary) 0%, var(--primary-light) 100%);
-        color: white;
-        border: none;
-        border-radius: var(--radius);
-        padding: 0.75rem 1.5rem;
-        font-weight: 600;
-        font-size: 0.9rem;
-        transition: all 0.3s ease;
-        box-shadow: var(--shadow);
-    }
-
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: var(--shadow-lg);
-    }
-
-    .stButton > button:active {
-        transform: translateY(0);
-    }
-
-    /* Primary button style */
-    .stButton > button[kind="primary"] {
-        background: linear-gradient(135deg, var(--secondary) 0%, #2f855a 100%);
-    }
-
-    /* ========================================
-       SIDEBAR
-       ======================================== */
-    section[data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #f8fafc 0%, #f1f5f9 100%);
-        box-shadow: 2px 0 10px rgba(0,0,0,0.05);
-        border-right: 1px solid #e2e8f0;
-    }
-
-    section[data-testid="stSidebar"] .stMarkdown {
-        color: #475569;
-    }
-
-    section[data-testid="stSidebar"] .stMarkdown h1,
-    section[data-testid="stSidebar"] .stMarkdown h2,
-    section[data-testid="stSidebar"] .stMarkdown h3 {
-        color: #1e3a5f !important;
-    }
-
-    section[data-testid="stSidebar"] label {
-        color: #475569 !important;
-    }
-
-    section[data-testid="stSidebar"] .stSelectbox label,
-    section[data-testid="stSidebar"] .stDateInput label {
-        color: #334155 !important;
-        font-weight: 500;
-    }
-
-    section[data-testid="stSidebar"] hr {
-        border-color: #e2e8f0;
-        margin: 1.5rem 0;
-    }
-
-    section[data-testid="stSidebar"] .stButton > button {
-        background: #ffffff;
-        border: 1px solid #e2e8f0;
-        color: #1e3a5f;
-        box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-    }
-
-    section[data-testid="stSidebar"] .stButton > button:hover {
-        background: #f1f5f9;
-        border-color: #cbd5e1;
-    }
-
-    /* Sidebar targets section */
-    .sidebar-targets {
-        background: #ffffff;
-        border-radius: var(--radius);
-        padding: 1rem;
-        margin-top: 1rem;
-        border: 1px solid #e2e8f0;
-    }
-
-    .sidebar-target-item {
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-        padding: 0.5rem 0;
-        border-bottom: 1px solid #e2e8f0;
-        font-size: 0.85rem;
-        color: #475569;
-    }
-
-    .sidebar-target-item:last-child {
-        border-bottom: none;
-    }
-
-    /* ========================================
-       DIVIDERS
-       ======================================== */
-    hr {
-        border: none;
-        border-top: 1px solid var(--border);
-        margin: 2.5rem 0;
-    }
-
-    .section-divider {
-        border: none;
-        border-top: 2px solid var(--border);
-        margin: 3rem 0;
-        position: relative;
-    }
-
-    /* ========================================
-       TABLES
-       ======================================== */
-    .stDataFrame {
-        border-radius: var(--radius);
-        overflow: hidden;
-        border: 1px solid var(--border);
-    }
-
-    .stDataFrame [data-testid="stDataFrameResizable"] {
-        border-radius: var(--radius);
-    }
-
-    /* ========================================
-       EXPANDABLE SECTIONS
-       ======================================== */
-    .streamlit-expanderHeader {
-        background: var(--surface);
-        border: 1px solid var(--border);
-        border-radius: var(--radius);
-        font-weight: 600;
-        color: var(--text);
-    }
-
-    .streamlit-expanderContent {
-        border: 1px solid var(--border);
-        border-top: none;
-        border-radius: 0 0 var(--radius) var(--radius);
-    }
-
-    /* Fix for broken icon - center align expander text */
-    [data-testid="stExpander"] summary {
-        justify-content: center !important;
-    }
-    [data-testid="stExpander"] summary > span:first-child {
-        display: none !important;
-    }
-
-    /* ========================================
-       PRINT VIEW STYLES
-       ======================================== */
-    .print-button-container {
-        position: fixed;
-        top: 70px;
-        right: 20px;
-        z-index: 1000;
-    }
-
-    .print-button {
-        background: linear-gradient(135deg, #1a365d 0%, #2c5282 100%);
-        color: white;
-        border: none;
-        border-radius: 50px;
-        padding: 0.75rem 1.5rem;
-        font-weight: 600;
-        font-size: 0.9rem;
-        cursor: pointer;
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        box-shadow: var(--shadow-lg);
-        transition: all 0.3s ease;
-    }
-
-    .print-button:hover {
-        transform: translateY(-2px);
-        box-shadow: var(--shadow-xl);
-    }
-
-    /* Print snapshot container */
-    .print-snapshot {
-        background: white;
-        padding: 2rem;
-        border-radius: var(--radius-xl);
-        box-shadow: var(--shadow-xl);
-        margin-bottom: 2rem;
-        border: 1px solid var(--border);
-    }
-
-    .print-snapshot-header {
-        text-align: center;
-        margin-bottom: 2rem;
-        padding-bottom: 1.5rem;
-        border-bottom: 2px solid var(--border);
-    }
-
-    .print-snapshot-title {
-        font-size: 1.75rem;
-        font-weight: 800;
-        color: var(--primary);
-        margin: 0;
-    }
-
-    .print-snapshot-subtitle {
-        color: var(--text-muted);
-        margin: 0.5rem 0 0 0;
-    }
-
-    .print-goals-grid {
-        display: grid;
-        grid-template-columns: repeat(2, 1fr);
-        gap: 1.5rem;
-        margin-bottom: 1.5rem;
-    }
-
-    .print-goal-card {
-        background: linear-gradient(135deg, #f7fafc 0%, white 100%);
-        border-radius: var(--radius);
-        padding: 1.25rem;
-        border: 1px solid var(--border);
-        position: relative;
-        overflow: hidden;
-    }
-
-    .print-goal-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 3px;
-    }
-
-    .print-goal-card.g1::before { background: linear-gradient(90deg, #667eea, #764ba2); }
-    .print-goal-card.g2::before { background: linear-gradient(90deg, #f093fb, #f5576c); }
-    .print-goal-card.g3::before { background: linear-gradient(90deg, #4facfe, #00f2fe); }
-    .print-goal-card.g4::before { background: linear-gradient(90deg, #43e97b, #38f9d7); }
-
-    .print-goal-title {
-        font-size: 0.9rem;
-        font-weight: 700;
-        color: var(--primary);
-        margin: 0 0 0.75rem 0;
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-    }
-
-    .print-metrics-row {
-        display: flex;
-        gap: 1rem;
-        flex-wrap: wrap;
-    }
-
-    .print-metric {
-        flex: 1;
-        min-width: 80px;
-        text-align: center;
-        padding: 0.5rem;
-        background: white;
-        border-radius: 6px;
-        border: 1px solid var(--border);
-    }
-
-    .print-metric-value {
-        font-size: 1.1rem;
-        font-weight: 700;
-        color: var(--text);
-    }
-
-    .print-metric-label {
-        font-size: 0.7rem;
-        color: var(--text-muted);
-        margin-top: 0.25rem;
-    }
-
-    .print-progress {
-        margin-top: 0.75rem;
-    }
-
-    .print-progress-bar {
-        height: 6px;
-        background: var(--border);
-        border-radius: 100px;
-        overflow: hidden;
-    }
-
-    .print-progress-fill {
-        height: 100%;
-        border-radius: 100px;
-    }
-
-    .print-progress-fill.g1 { background: linear-gradient(90deg, #667eea, #764ba2); }
-    .print-progress-fill.g2 { background: linear-gradient(90deg, #f093fb, #f5576c); }
-    .print-progress-fill.g3 { background: linear-gradient(90deg, #4facfe, #00f2fe); }
-    .print-progress-fill.g4 { background: linear-gradient(90deg, #43e97b, #38f9d7); }
-
-    .print-progress-text {
-        font-size: 0.7rem;
-        color: var(--text-muted);
-        text-align: right;
-        margin-top: 0.25rem;
-    }
-
-    /* ========================================
-       PRINT MEDIA QUERIES
-       ======================================== */
-    @media print {
-        /* Hide non-essential elements */
-        section[data-testid="stSidebar"],
-        .stButton,
-        .print-button-container,
-        header,
-        footer,
-        #MainMenu,
-        .stSelectbox,
-        .stDateInput,
-        .stCheckbox,
-        [data-testid="stToolbar"],
-        .hero-container,
-        hr {
-            display: none !important;
-        }
-
-        /* Show only print snapshot */
-        .main .block-container {
-            padding: 0 !important;
-            max-width: 100% !important;
-        }
-
-        .print-snapshot {
-            box-shadow: none !important;
-            border: none !important;
-            padding: 0.5in !important;
-            margin: 0 !important;
-            page-break-inside: avoid;
-        }
-
-        .print-goals-grid {
-            grid-template-columns: repeat(2, 1fr) !important;
-        }
-
-        /* Ensure colors print */
-        * {
-            -webkit-print-color-adjust: exact !important;
-            print-color-adjust: exact !important;
-        }
-
-        @page {
-            size: letter landscape;
-            margin: 0.25in;
-        }
-    }
-
-    /* ========================================
-       ANIMATIONS
-       ======================================== */
-    @keyframes fadeInUp {
-        from {
-            opacity: 0;
-            transform: translateY(20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-
-    .goal-card, .metric-card, div[data-testid="metric-container"] {
-        animation: fadeInUp 0.5s ease-out forwards;
-    }
-
-    /* Staggered animation delays */
-    .goal-card:nth-child(1) { animation-delay: 0.1s; }
-    .goal-card:nth-child(2) { animation-delay: 0.2s; }
-    .goal-card:nth-child(3) { animation-delay: 0.3s; }
-    .goal-card:nth-child(4) { animation-delay: 0.4s; }
-
-    /* ========================================
-       RESPONSIVE / MOBILE STYLES
-       ======================================== */
-
-    /* Tablet styles */
-    @media screen and (max-width: 1024px) {
-        .main .block-container {
-            padding: 1rem 1.5rem 2rem 1.5rem;
-            max-width: 100%;
-        }
-
-        .hero-container {
-            padding: 1.5rem 2rem;
-        }
-
-        .hero-stat-value {
-            font-size: 2rem !important;
-        }
-
-        .section-title {
-            font-size: 1.3rem !important;
-        }
-
-        /* Make 4-column grids into 2-column on tablets */
-        div[style*="grid-template-columns: repeat(4"] {
-            grid-template-columns: repeat(2, 1fr) !important;
-        }
-
-        /* Plotly charts responsive */
-        .js-plotly-plot, .plotly, .plot-container {
-            width: 100% !important;
-        }
-    }
-
-    /* Mobile styles */
-    @media screen and (max-width: 768px) {
-        .main .block-container {
-            padding: 0.75rem 1rem 2rem 1rem;
-        }
-
-        .hero-container {
-            padding: 1.25rem 1.5rem;
-            border-radius: var(--radius-lg);
-        }
-
-        .hero-stat-value {
-            font-size: 1.5rem !important;
-        }
-
-        .hero-stat-label {
-            font-size: 0.7rem !important;
-        }
-
-        .section-header {
-            flex-direction: column;
-            align-items: flex-start !important;
-            gap: 0.5rem;
-        }
+    The minus sign goes before the $ so Streamlit recognizes negative values.
+    """
+    diff = actual - budget
+    pct = (diff / abs(budget) * 100) if budget != 0 else 0
+    sign = "+" if diff >= 0 else "-"
+    return f"{sign}${abs(diff):,.0f} ({pct:.1f}%)"
 
-        .section-icon {
-            width: 40px;
-            height: 40px;
-            font-size: 1.25rem;
-        }
 
-        .section-title {
-            font-size: 1.1rem !important;
-        }
+def _pct_change(curr, prior):
+    """Percent change from prior to curr, element-wise for arrays.
 
-        .section-subtitle {
-            font-size: 0.75rem !important;
-        }
+    Growth from zero counts as 100% and zero to zero as 0%. Scalars come back
+    as 0-d arrays, so wrap in float() when a plain number is needed.
+    """
+    curr = np.asarray(curr, dtype=float)
+    prior = np.asarray(prior, dtype=float)
+    has_prior = prior > 0
+    return np.where(
+        has_prior,
+        (curr - prior) / np.where(has_prior, prior, 1) * 100,
+        np.where(curr > 0, 100.0, 0.0)
+    )
 
-        .section-note {
-            font-size: 0.7rem !important;
-        }
 
-        /* Stack metric cards on mobile */
-        div[data-testid="column"] {
-            min-width: 100% !important;
-        }
+def format_money(value: float, m_decimals: int = 2, k_decimals: int = 0) -> str:
+    """Format a dollar amount compactly as $1.23M, $45K or $678.
 
-        div[data-testid="metric-container"] {
-            padding: 0.75rem !important;
-        }
+    Examples:
+        1234567 -> "$1.23M"
+        45678 -> "$46K"
+        678 -> "$678"
+    """
+    magnitude = abs(value)
+    if magnitude >= 1_000_000:
+        return f"${value / 1_000_000:.{m_decimals}f}M"
+    if magnitude >= 1000:
+        return f"${value / 1000:.{k_decimals}f}K"
+    return f"${value:,.0f}"
 
-        div[data-testid="metric-container"] label {
-            font-size: 0.75rem !important;
-        }
 
-        div[data-testid="metric-container"] div[data-testid="stMetricValue"] {
-            font-size: 1.25rem !important;
-        }
+def _flatten_listcol(series: pd.Series) -> pd.Series:
+    """Flatten Fusioo list cells: single-item lists become the item, longer lists a comma-joined string.
 
-        /* Progress bars */
-        .progress-container {
-            height: 8px;
-        }
+    Returns the series unchanged when it holds no lists.
+    """
+    is_list = series.map(type).eq(list).to_numpy()
+    if not is_list.any():
+        return series
+    lists = series[is_list]
+    single = lists.str.len().eq(1)
+    flat = lists.str[0].where(single)
+    if not single.all():
+        # Only the (usually few) multi-item or empty lists need a Python-level join
+        flat[~single] = lists[~single].map(lambda v: ", ".join(map(str, v)))
+    out = series.astype(object)
+    out[is_list] = flat.to_numpy()
+    return out
 
-        /* Charts responsive */
-        .js-plotly-plot, .plotly {
-            width: 100% !important;
-        }
 
-        /* Sidebar adjustments */
-        section[data-testid="stSidebar"] {
-            width: 280px !important;
-            min-width: 280px !important;
-        }
+def _unwrap_singleton_lists(df: pd.DataFrame) -> pd.DataFrame:
+    """Unwrap single-item Fusioo list cells to the item, in place; longer and empty lists are kept."""
+    for col in df.select_dtypes(include='object').columns:
+        sample = df[col].dropna().head(1)
+        if sample.empty or not isinstance(sample.iloc[0], list):
+            continue
+        values = df[col]
+        single = values.map(type).eq(list) & values.str.len().eq(1)
+        df[col] = values.where(~single, values.str[0])
+    return df
 
-        section[data-testid="stSidebar"] > div {
-            padding: 1rem;
-        }
 
-        /* Make 4-column grids into 2-column on tablets */
-        div[style*="grid-template-columns: repeat(4"] {
-            grid-template-columns: repeat(2, 1fr) !important;
-        }
+def _mask_range(dt_series: pd.Series, lo, hi) -> pd.Series:
+    """Boolean mask of dates within [lo, hi] (inclusive); NaT is never in range."""
+    return dt_series.between(pd.Timestamp(lo), pd.Timestamp(hi))
 
-        /* Metric cards responsive */
-        .metric-card {
-            padding: 1rem !important;
-        }
 
-        .metric-card div[style*="font-size: 1.75rem"] {
-            font-size: 1.5rem !important;
-        }
-    }
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
 
-    /* Small mobile styles */
-    @media screen and (max-width: 480px) {
-        .main .block-container {
-            padding: 0.5rem 0.75rem 1.5rem 0.75rem;
-        }
 
-        .hero-container {
-            padding: 1rem;
-        }
+def _parse_fusioo_dates(series: pd.Series) -> pd.Series:
+    """Parse Fusioo date values (optionally "date|time") to datetime64; unparseable values become NaT.
 
-        .hero-stat-value {
-            font-size: 1.25rem !important;
-        }
+    The first value is probed once so plain ISO dates are parsed with an explicit format.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    dates = series.astype(str).str.split("|", n=1).str[0]  # Drop Fusioo "|time" suffix
+    sample = dates[series.notna()].head(1)
+    fmt = '%Y-%m-%d' if not sample.empty and _ISO_DATE_RE.fullmatch(sample.iloc[0]) else None
+    return pd.to_datetime(dates, format=fmt, errors='coerce', cache=True)
+
+
+def _filter_records_by_date(records: list, start_date, end_date) -> list:
+    """Keep activity records whose date_of_activity (or legacy date) falls within the range."""
+    raw_dates = pd.Series([record.get('date_of_activity') or record.get('date') for record in records], dtype=object)
+
+    # Fusioo can wrap the date in a single-item list; longer lists are not one date
+    is_list = raw_dates.map(type).eq(list)
+    if is_list.any():
+        lists = raw_dates[is_list]
+        raw_dates[is_list] = lists.str[0].where(lists.str.len().eq(1))
+    raw_dates = raw_dates.where(raw_dates.notna(), '').astype(str).str.strip()
+
+    # Plain ISO dates in one formatted pass; any other format is parsed value by value
+    record_dates = pd.to_datetime(raw_dates, format='%Y-%m-%d', errors='coerce', cache=True)
+    leftover = (record_dates.isna() & raw_dates.ne('')).to_numpy()
+    if leftover.any():
+        record_dates[leftover] = pd.to_datetime(raw_dates[leftover], format='mixed', errors='coerce', cache=True)
+    in_range = _mask_range(record_dates, start_date, end_date).tolist()
+    return [record for record, keep in zip(records, in_range) if keep]
 
-        .section-title {
-            font-size: 1rem !important;
-        }
 
-        div[data-testid="metric-container"] div[data-testid="stMetricValue"] {
-            font-size: 1.1rem !important;
-        }
+# Brand Colors
+COLORS = {
+    "primary": "#1a365d",       # Deep navy blue
+    "primary_light": "#2c5282",
+    "secondary": "#38a169",     # Success green
+    "accent": "#ed8936",        # Warm orange
+    "accent_alt": "#9f7aea",    # Purple
+    "background": "#f7fafc",
+    "surface": "#ffffff",
+    "text": "#1a202c",
+    "text_muted": "#718096",
+    "border": "#e2e8f0",
+    "gradient_start": "#667eea",
+    "gradient_end": "#764ba2",
+}
 
-        /* Hide less important elements on very small screens */
-        .section-subtitle, .section-note {
-            display: none;
-        }
+# Page config
+st.set_page_config(
+    page_title="BookSpring Strategic Dashboard",
+    page_icon="📚",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
 
-        /* Make all grids single column on mobile */
-        div[style*="grid-template-columns: repeat(4"],
-        div[style*="grid-template-columns: repeat(2"] {
-            grid-template-columns: 1fr !important;
-        }
+# Modern CSS with glassmorphism, animations, and beautiful styling
+DASHBOARD_CSS_PATH = Path(__file__).parent / "dashboard.css"
 
-        /* Smaller metric card text on mobile */
-        .metric-card div[style*="font-size: 1.75rem"],
-        .metric-card div[style*="font-size: 1.5rem"] {
-            font-size: 1.25rem !important;
-        }
 
-        .metric-card div[style*="font-size: 0.85rem"] {
-            font-size: 0.75rem !important;
-        }
-    }
+@st.cache_data(ttl=3600)
+def load_css() -> str:
+    """Read the dashboard stylesheet from disk."""
+    return DASHBOARD_CSS_PATH.read_text(encoding="utf-8")
 
-    /* Ensure touch-friendly tap targets */
-    @media (hover: none) and (pointer: coarse) {
-        button, .stButton > button {
-            min-height: 44px;
-            min-width: 44px;
-        }
 
-        input, select, textarea {
-            font-size: 16px !important; /* Prevents zoom on iOS */
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 
 # Chart theme configuration
@@ -1220,9 +291,12 @@ CHART_TEMPLATE = {
 }
 
 
-def style_plotly_chart(fig, height=350):
-    """Apply consistent styling to Plotly charts."""
-    fig.update_layout(
+CHART_AXIS_STYLE = dict(gridcolor="#e2e8f0", linecolor="#e2e8f0", tickfont=dict(size=11))
+
+
+def _chart_base_layout(height: int) -> dict:
+    """Layout settings shared by all dashboard charts (axes excluded)."""
+    return dict(
         font_family="Inter, sans-serif",
         paper_bgcolor="rgba(0,0,0,0)",
         plot_bgcolor="rgba(0,0,0,0)",
@@ -1241,16 +315,174 @@ def style_plotly_chart(fig, height=350):
             font=dict(size=11)
         )
     )
-    fig.update_xaxes(gridcolor="#e2e8f0", linecolor="#e2e8f0", tickfont=dict(size=11))
-    fig.update_yaxes(gridcolor="#e2e8f0", linecolor="#e2e8f0", tickfont=dict(size=11))
+
+
+def style_plotly_chart(fig, height=350):
+    """Apply consistent styling to Plotly charts."""
+    fig.update_layout(**_chart_base_layout(height))
+    fig.update_xaxes(**CHART_AXIS_STYLE)
+    fig.update_yaxes(**CHART_AXIS_STYLE)
     return fig
 
 
+def plotly_chart_layout(height=350, **overrides) -> dict:
+    """Build a styled layout dict for single-axis charts, for use as go.Figure(layout=...).
+
+    Same styling as style_plotly_chart, but merged with the chart's own settings up
+    front so the figure is laid out in one pass. Dict overrides (legend, xaxis, yaxis)
+    are merged into the shared styling instead of replacing it.
+    """
+    layout = _chart_base_layout(height)
+    layout['xaxis'] = dict(CHART_AXIS_STYLE)
+    layout['yaxis'] = dict(CHART_AXIS_STYLE)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(layout.get(key), dict):
+            layout[key] = {**layout[key], **value}
+        else:
+            layout[key] = value
+    return layout
+
+
+# Line colors for the trends charts
+_TREND_COLORS = ("#667eea", "#38a169", "#ed8936", "#9f7aea", "#f5576c")
+_ENGAGEMENT_COLORS = ("#f093fb", "#f5576c")
+
+# Books per child age group lines and categorical pie slices
+_AGE_GROUP_COLORS = ("#3b82f6", "#10b981", "#f59e0b", "#8b5cf6", "#ef4444")
+_CATEGORY_COLORS = ("#3b82f6", "#10b981", "#f59e0b", "#8b5cf6", "#ec4899", "#06b6d4", "#84cc16")
+
+# Consistent view colors across charts: Digital=blue, Newsletter=green
+VIEW_COLOR_MAP = MappingProxyType({
+    "Digital": "#3b82f6",
+    "Newsletter": "#10b981",
+    "Digital Views": "#3b82f6",
+    "Newsletter Views": "#10b981",
+})
+
+
+# Progress ring drawn as inline SVG. The arc is a stroked circle whose dash length is the
+# filled fraction; the transform mirrors it so it starts at 12 o'clock and runs counterclockwise
+RING_RADIUS = 85
+RING_CIRCUMFERENCE = 2 * math.pi * RING_RADIUS
+_RING_SVG_TEMPLATE = (
+    '<div style="display: flex; justify-content: center; padding: {padding}px 0;">'
+    '<svg viewBox="0 0 200 200" width="{size}" height="{size}" role="img">'
+    '<g transform="matrix(0 -1 -1 0 100 100)" fill="none" stroke-width="30">'
+    '<circle r="{radius}" stroke="{color_remaining}"/>'
+    '<circle r="{radius}" stroke="{color_fill}" stroke-dasharray="{filled:.2f} {circumference:.2f}"/>'
+    '</g>'
+    '<text x="100" y="94" text-anchor="middle" dominant-baseline="middle" font-family="system-ui" '
+    'font-size="{main_size:.1f}" font-weight="700" fill="#1a365d">{main_text}</text>'
+    '<text x="100" y="124" text-anchor="middle" dominant-baseline="middle" font-family="system-ui" '
+    'font-size="{sub_size:.1f}" fill="#64748b">{sub_text}</text>'
+    '</svg></div>'
+)
+
+
+def create_ring_svg(main_text: str, sub_text: str, pct: float, color_fill: str,
+                    color_remaining: str = '#e2e8f0', size: int = 170,
+                    main_size: int = 22, sub_size: int = 12, padding: int = 30) -> str:
+    """Build an HTML/SVG donut showing progress toward a target.
+
+    Args:
+        main_text: Large label in the center of the ring
+        sub_text: Smaller label under the main text
+        pct: Percent of target reached (clamped to 0-100 for the arc)
+        color_fill: Color of the filled arc
+        color_remaining: Color of the unfilled track
+        size: Rendered width/height in pixels
+        main_size: Main label font size in pixels
+        sub_size: Sub label font size in pixels
+        padding: Vertical padding in pixels around the ring
+
+    Returns:
+        HTML string for st.markdown(..., unsafe_allow_html=True)
+    """
+    display_pct = min(max(pct, 0), 100)
+    scale = 200 / size  # Font sizes are given in screen pixels, the SVG draws in viewBox units
+    return _RING_SVG_TEMPLATE.format(
+        padding=padding,
+        size=size,
+        radius=RING_RADIUS,
+        color_remaining=color_remaining,
+        color_fill=color_fill,
+        filled=RING_CIRCUMFERENCE * display_pct / 100,
+        circumference=RING_CIRCUMFERENCE,
+        main_size=main_size * scale,
+        sub_size=sub_size * scale,
+        main_text=main_text,
+        sub_text=sub_text,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def create_progress_ring(received: float, goal: float, pct: float, title: str, color_fill: str, color_remaining: str,
+                         value_format: str = "currency") -> tuple:
+    """Create a donut showing progress toward goal.
+
+    Args:
+        value_format: "currency" for $K/$M amounts, "count" for plain counts (e.g. books)
+
+    Returns:
+        Tuple of (SVG ring HTML, formatted goal string)
+    """
+    if value_format == "count":
+        received_str = f"{received:,.0f}"
+        goal_str = f"{goal/1000:.0f}K" if goal >= 1000 else f"{goal:,.0f}"
+    else:
+        received_str = format_money(received)
+        goal_str = format_money(goal, m_decimals=1)
+
+    # Ring capped at 100% by create_ring_svg, actual percentage shown in text
+    ring_html = create_ring_svg(
+        received_str, f"{pct:.0f}% of goal", pct, color_fill, color_remaining,
+        size=140, padding=30
+    )
+    return ring_html, goal_str
+
+
+@st.cache_resource
+def get_fusioo_client() -> FusiooClient:
+    """Shared Fusioo API client, created once per server process."""
+    return FusiooClient()
+
+
+@st.cache_resource
+def get_gspread_client():
+    """Authorized Google Sheets client, or None when no credentials are configured.
+
+    Cached as a resource so the service account token exchange runs once per
+    process; gspread refreshes the token itself when it expires.
+    """
+    # Google Sheets imports - only needed here, so sessions without credentials skip them
+    import gspread
+    from google.oauth2.service_account import Credentials
+
+    # Get credentials from Streamlit secrets or environment
+    if hasattr(st, 'secrets') and 'gcp_service_account' in st.secrets:
+        creds_dict = dict(st.secrets["gcp_service_account"])
+    else:
+        # For local development, try to load from file
+        creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+        if creds_path and os.path.exists(creds_path):
+            with open(creds_path, 'r') as f:
+                creds_dict = json.load(f)
+        else:
+            return None
+
+    scopes = [
+        "https://www.googleapis.com/auth/spreadsheets.readonly",
+        "https://www.googleapis.com/auth/drive.readonly"
+    ]
+    creds = Credentials.from_service_account_info(creds_dict, scopes=scopes)
+    return gspread.authorize(creds)
+
+
 @st.cache_data(ttl=86400)  # Cache for 24 hours
 def load_activity_data():
     """Load activity data from Fusioo API with caching."""
     try:
-        client = FusiooClient()
+        client = get_fusioo_client()
         records = client.get_all_records(ACTIVITY_REPORT_APP_ID)
         return records
     except Exception as e:
@@ -1262,7 +494,7 @@ def load_activity_data():
 def load_original_books():
     """Load Original Books data from Fusioo API."""
     try:
-        client = FusiooClient()
+        client = get_fusioo_client()
         records = client.get_all_records(ORIGINAL_BOOKS_APP_ID)
         return records
     except Exception as e:
@@ -1274,7 +506,7 @@ def load_original_books():
 def load_content_views():
     """Load Content Views data from Fusioo API."""
     try:
-        client = FusiooClient()
+        client = get_fusioo_client()
         records = client.get_all_records(CONTENT_VIEWS_APP_ID)
         return records
     except Exception as e:
@@ -1286,7 +518,7 @@ def load_content_views():
 def load_legacy_data():
     """Load legacy activity data from Fusioo API (pre-July 2025)."""
     try:
-        client = FusiooClient()
+        client = get_fusioo_client()
         records = client.get_all_records(LEGACY_DATA_APP_ID)
         return records
     except Exception as e:
@@ -1301,7 +533,7 @@ def load_active_enrollment_count():
     Only reads the active_enrollment field for counting - other fields are not stored.
     """
     try:
-        client = FusiooClient()
+        client = get_fusioo_client()
         count = client.count_active_enrollments(B3_CHILD_FAMILY_APP_ID)
         return count
     except Exception as e:
@@ -1317,7 +549,7 @@ def load_b3_low_income_stats():
     Returns tuple of (active_count, low_income_pct).
     """
     try:
-        client = FusiooClient()
+        client = get_fusioo_client()
 
         # Count all active enrollments
         active_filters = {"active_enrollment": {"equal": True}}
@@ -1361,24 +593,9 @@ def _get_ttl_until_noon_refresh():
 def load_financial_data():
     """Load financial data from Google Sheets."""
     try:
-        # Get credentials from Streamlit secrets or environment
-        if hasattr(st, 'secrets') and 'gcp_service_account' in st.secrets:
-            creds_dict = dict(st.secrets["gcp_service_account"])
-        else:
-            # For local development, try to load from file
-            creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-            if creds_path and os.path.exists(creds_path):
-                with open(creds_path, 'r') as f:
-                    creds_dict = json.load(f)
-            else:
-                return None
-
-        scopes = [
-            "https://www.googleapis.com/auth/spreadsheets.readonly",
-            "https://www.googleapis.com/auth/drive.readonly"
-        ]
-        creds = Credentials.from_service_account_info(creds_dict, scopes=scopes)
-        client = gspread.authorize(creds)
+        client = get_gspread_client()
+        if client is None:
+            return None
 
         sheet = client.open_by_key(FINANCIAL_SHEET_ID).sheet1
         data = sheet.get_all_records()
@@ -1387,7 +604,10 @@ def load_financial_data():
             df = pd.DataFrame(data)
             # Convert date column if present
             if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'], errors='coerce')
+                # Sheet dates are usually ISO; an explicit format skips per-value inference
+                first = next((v for v in df['date'] if isinstance(v, str) and v), None)
+                date_format = 'ISO8601' if first and _ISO_DATE_RE.match(first) else None
+                df['date'] = pd.to_datetime(df['date'], format=date_format, errors='coerce')
             return df
         return pd.DataFrame()
     except Exception as e:
@@ -1399,7 +619,7 @@ def load_financial_data():
 def load_events_data():
     """Load events data from Fusioo."""
     try:
-        client = FusiooClient()
+        client = get_fusioo_client()
         records = client.get_all_records(EVENTS_APP_ID)
         return records
     except Exception as e:
@@ -1411,7 +631,7 @@ def load_events_data():
 def load_partners_data():
     """Load partners data from Fusioo for partner name lookups and low income stats."""
     try:
-        client = FusiooClient()
+        client = get_fusioo_client()
         # Fetch fields needed for display and low income calculation - avoid loading PII
         records = client.get_all_records(PARTNERS_APP_ID, fields=["id", "site_name", "main_organization_from_list", "percentage_lowincome"])
         return records
@@ -1420,6 +640,18 @@ def load_partners_data():
         return []
 
 
+@st.cache_data(ttl=86400)  # Cache for 24 hours
+def load_inventory_data():
+    """Load Inventory Data records from Fusioo."""
+    try:
+        client = get_fusioo_client()
+        records = client.get_all_records(INVENTORY_APP_ID)
+        return records
+    except Exception as e:
+        st.error(f"Failed to load inventory data: {e}")
+        return []
+
+
 @st.cache_data(ttl=86400)  # Cache for 24 hours
 def load_donated_books_count(start_date: str, end_date: str):
     """Load donated books count from Fusioo Inventory Data for a date range.
@@ -1429,8 +661,7 @@ def load_donated_books_count(start_date: str, end_date: str):
     Returns sum of total_books_this_entry for matching records.
     """
     try:
-        client = FusiooClient()
-        records = client.get_all_records(INVENTORY_APP_ID)
+        records = load_inventory_data()
 
         # Parse date range
         start_dt = pd.to_datetime(start_date).date()
@@ -1478,6 +709,53 @@ def load_donated_books_count(start_date: str, end_date: str):
         return 0
 
 
+@st.cache_resource
+def get_donorperfect_session() -> requests.Session:
+    """Pooled HTTP session for DonorPerfect queries (keep-alive, retries).
+
+    Only connection errors and gateway errors are retried; a read timeout on a slow
+    query is not, so it fails after one timeout instead of several.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10,
+                          max_retries=Retry(total=3, read=0, status_forcelist=(502, 503, 504),
+                                            backoff_factor=0.2))
+    session.mount("https://", adapter)
+    return session
+
+
+# Line breaks plus surrounding indentation in the multi-line SQL query literals
+_SQL_LAYOUT_WS_RE = re.compile(r'\s*\n\s*')
+
+
+def _donorperfect_action(query: str) -> str:
+    """URL-encode a SQL query for the DonorPerfect action parameter.
+
+    Query layout whitespace is collapsed first, which keeps the URL (and the
+    quoting work) short; SQL string literals never span lines.
+    """
+    return quote(_SQL_LAYOUT_WS_RE.sub(' ', query.strip()))
+
+
+def _parse_donorperfect_records(content: bytes) -> list:
+    """Parse a DonorPerfect XML response into a list of record dicts.
+
+    DonorPerfect returns: <result><record><field name='x' value='y'/></record></result>
+    Records are streamed with iterparse and released from the root once read, so
+    the full tree is never built.
+    """
+    records = []
+    context = ET.iterparse(io.BytesIO(content), events=('start', 'end'))
+    _, root = next(context)  # <result>
+    for event, elem in context:
+        if event == 'end' and elem.tag == 'record':
+            # Value is in 'value' attribute, not text
+            records.append({field.get('name'): field.get('value') for field in elem.findall('field')})
+            elem.clear()
+            root.clear()
+    return records
+
+
 def _execute_donorperfect_query(query: str) -> tuple:
     """Execute a single DonorPerfect query and return results.
 
@@ -1489,26 +767,16 @@ def _execute_donorperfect_query(query: str) -> tuple:
     """
     debug_info = {'query': query}
     try:
-        url = f"{DONORPERFECT_BASE_URL}?apikey={DONORPERFECT_API_KEY}&action={quote(query)}"
-        debug_info['url'] = f"{DONORPERFECT_BASE_URL}?apikey=****&action={quote(query)}"
+        action = _donorperfect_action(query)
+        url = f"{DONORPERFECT_BASE_URL}?apikey={DONORPERFECT_API_KEY}&action={action}"
+        debug_info['url'] = f"{DONORPERFECT_BASE_URL}?apikey=****&action={action}"
 
-        response = requests.get(url, timeout=60)
+        response = get_donorperfect_session().get(url, timeout=60)
         response.raise_for_status()
         debug_info['status_code'] = response.status_code
         debug_info['response_preview'] = response.text[:1000] if response.text else "Empty response"
 
-        # Parse XML response
-        # DonorPerfect returns: <result><record><field name='x' value='y'/></record></result>
-        root = ET.fromstring(response.content)
-
-        records = []
-        for rec in root.findall('.//record'):
-            record = {}
-            for field in rec.findall('field'):
-                name = field.get('name')
-                value = field.get('value')  # Value is in 'value' attribute, not text
-                record[name] = value
-            records.append(record)
+        records = _parse_donorperfect_records(response.content)
 
         debug_info['records_found'] = len(records)
         return records, debug_info
@@ -1559,31 +827,21 @@ def load_donorperfect_contact_metrics(start_date: str, end_date: str) -> dict:
     total = 0
     for rec in by_type_records:
         code = rec.get('activity_code') or 'LT'  # Treat blank as LT
-        if code == '':
-            code = 'LT'
         cnt = int(rec.get('cnt', 0) or 0)
         # Merge blank into LT
-        if code in by_type:
-            by_type[code] += cnt
-        else:
-            by_type[code] = cnt
+        by_type[code] = by_type.get(code, 0) + cnt
         total += cnt
 
+    # Blank and NULL both map to 'Unknown', so their counts are summed
     cc_by_status = {}
     for rec in cc_status_records:
         status = rec.get('em_campaign_status') or 'Unknown'
-        if status == '':
-            status = 'Unknown'
-        cnt = int(rec.get('cnt', 0) or 0)
-        cc_by_status[status] = cnt
+        cc_by_status[status] = cc_by_status.get(status, 0) + int(rec.get('cnt', 0) or 0)
 
     lt_by_mailing = {}
     for rec in lt_mailing_records:
         mailing = rec.get('mailing_code') or 'Unknown'
-        if mailing == '':
-            mailing = 'Unknown'
-        cnt = int(rec.get('cnt', 0) or 0)
-        lt_by_mailing[mailing] = cnt
+        lt_by_mailing[mailing] = lt_by_mailing.get(mailing, 0) + int(rec.get('cnt', 0) or 0)
 
     by_month = {}
     for rec in monthly_records:
@@ -1665,9 +923,14 @@ def get_contact_metrics_comparison() -> dict:
     prior_fy_start = fy_info['prior_fy_start'].strftime("%Y-%m-%d")
     prior_fy_end = today.replace(year=today.year - 1).strftime("%Y-%m-%d")
 
-    # Load aggregated metrics (these use GROUP BY queries to avoid 500 row limit)
-    current_metrics = load_donorperfect_contact_metrics(current_fy_start, current_fy_end)
-    prior_metrics = load_donorperfect_contact_metrics(prior_fy_start, prior_fy_end)
+    # Load aggregated metrics (these use GROUP BY queries to avoid 500 row limit);
+    # the two periods are independent, so fetch them concurrently
+    metrics = _load_in_parallel({
+        'current': lambda: load_donorperfect_contact_metrics(current_fy_start, current_fy_end),
+        'prior': lambda: load_donorperfect_contact_metrics(prior_fy_start, prior_fy_end),
+    }, max_workers=2)
+    current_metrics = metrics['current']
+    prior_metrics = metrics['prior']
 
     current_fy_short = fy_info['current_fy_short']
     prior_fy_short = fy_info['prior_fy_short']
@@ -1682,6 +945,101 @@ def get_contact_metrics_comparison() -> dict:
     }
 
 
+# Display order for DonorPerfect contact activity codes (unknown codes sort after, alphabetically)
+CONTACT_TYPE_ORDER = (
+    'DONORACTIVITY', 'GRANTACTIVITY',
+    'CC', 'EO', 'EI', 'GE', 'MA', 'LT', 'RCPTSNT', 'TYNOTE',
+    'TE', 'ME', 'ZOOMCALL', 'VI', 'EVENT', 'EV_IN', 'LUNCHEONINVITE',
+    'GFU', 'GP', 'GLOI', 'GRANTAWARD', 'GRANTDECLINED', 'GR', 'FIREP',
+    'APPLICATION', 'APPDUE', 'CONTRACT', 'PLEDGE', 'FOLLOWUP',
+    'FBS', 'YEA_MAIL', 'BIRTHDAYCARD', 'ANNUALREPORT',
+    'SP', 'SPONSORSHIPAGREEMENT', 'CAPITALCAMPAIGNCULTIVATION', 'MAJORGIFTSCULTIVATION',
+    'PROSPECTRESEARCH', 'GENERALINFO'
+)
+CONTACT_TYPE_ORDER_INDEX = {code: i for i, code in enumerate(CONTACT_TYPE_ORDER)}
+
+# Display labels for DonorPerfect contact activity codes (read-only)
+CONTACT_TYPE_LABELS = MappingProxyType({
+    'ANNUALREPORT': 'Annual Report',
+    'APPLICATION': 'Application',
+    'APPDUE': 'Application Due Date',
+    'BIRTHDAYCARD': 'Birthday Card',
+    'CAPITALCAMPAIGNCULTIVATION': 'Capital Campaign Cultivation',
+    'CC': 'Constant Contact Campaign',
+    'CONTRACT': 'Contract',
+    'EI': 'Email In',
+    'EO': 'Email Out',
+    'EVENT': 'Event',
+    'EV_IN': 'Event Invite',
+    'FBS': 'FBS Appeal',
+    'FIREP': 'Final Report',
+    'FOLLOWUP': 'Follow Up with Donor',
+    'GENERALINFO': 'General Info',
+    'GE': 'Group E-Mail',
+    'GFU': 'Grant Follow-Up',
+    'GLOI': 'Grant LOI',
+    'GP': 'Grant Proposal',
+    'GR': 'Grant Report Due',
+    'GRANTAWARD': 'Grant Award',
+    'GRANTDECLINED': 'Grant Declined',
+    'LT': 'Letter',
+    'LUNCHEONINVITE': 'Luncheon Invitation',
+    'MA': 'Mailing',
+    'MAJORGIFTSCULTIVATION': 'Major Gifts Cultivation',
+    'ME': 'Meeting',
+    'PLEDGE': 'Pledge Follow Up',
+    'PROSPECTRESEARCH': 'Prospect Research',
+    'RCPTSNT': 'Receipt Sent',
+    'SP': 'Sponsorship Proposal',
+    'SPONSORSHIPAGREEMENT': 'Sponsorship Agreement',
+    'TE': 'Telephone Call',
+    'TYNOTE': 'Thank You Note',
+    'VI': 'Visit',
+    'YEA_MAIL': 'Year End Appeal Mailer',
+    'ZOOMCALL': 'Zoom Call',
+    'DONORACTIVITY': 'Donor Activity',
+    'GRANTACTIVITY': 'Grant Activity',
+})
+
+# Contact total card with YoY % change; filled via str.format()
+CONTACT_METRIC_CARD_HTML = """
+            <div class="metric-card" style="text-align: center; padding: 1.25rem;">
+                <div style="font-size: 0.85rem; color: #718096; margin-bottom: 0.5rem;">{label}</div>
+                <div style="font-size: 1.75rem; font-weight: 700; color: #1a365d;">{value:,}</div>
+                <div style="font-size: 0.8rem; color: {color}; margin-top: 0.25rem;">
+                    {sign}{pct:.1f}% vs {prior_fy}
+                </div>
+            </div>"""
+
+# Compact gift stat card (Goal 4 sustainability row); filled via str.format_map()
+GIFT_STAT_CARD_HTML = """
+                        <div class="metric-card" style="text-align: center; padding: 0.5rem;">
+                            <div style="font-size: 0.65rem; color: #718096; margin-bottom: 0.15rem;">{label}</div>
+                            <div style="font-size: 1rem; font-weight: 700; color: #1a365d;">{value}</div>
+                            <div style="font-size: 0.6rem; color: {color};">
+                                {sign}{chg:.0f}% vs {prior_fy_label}
+                            </div>
+                        </div>"""
+
+
+def _pct_change_annotations(labels, values, pct_changes) -> list:
+    """Build % change annotations placed after the current FY bar of a horizontal grouped bar chart."""
+    return [
+        dict(
+            x=val,
+            y=label,
+            text=f'  <b>({"+" if pct > 0 else ""}{pct:.0f}%)</b>',
+            showarrow=False,
+            font=dict(size=10, color='#38a169' if pct > 0 else '#e53e3e'),
+            xanchor='left',
+            yanchor='middle',
+            xshift=30,  # Shift right past the number text
+            yshift=-18  # Align with current FY bar
+        )
+        for label, val, pct in zip(labels, values, pct_changes)
+    ]
+
+
 # =============================================================================
 # DONOR COMPARISON METRICS (from DonorPerfect)
 # =============================================================================
@@ -1716,6 +1074,19 @@ GL_CODE_OTHER = {
 # Combined lookup for all GL codes
 GL_CODE_LABELS = {**GL_CODE_GIFTS, **GL_CODE_GRANTS, **GL_CODE_OTHER}
 
+# SQL IN-list of grant GL codes, built once from the constant above
+GRANT_GL_CODES_SQL = ", ".join(f"'{code}'" for code in GL_CODE_GRANTS)
+
+
+def _sql_date(value) -> str:
+    """Quote a date for DonorPerfect SQL after validating it is a real YYYY-MM-DD date.
+
+    The XML API only accepts raw SQL text (no bound parameters), so values are
+    validated before interpolation instead.
+    """
+    return f"'{date.fromisoformat(str(value)).isoformat()}'"
+
+
 # Base filter for Individual donors (non-organization, gift records, gift GL codes)
 INDIVIDUAL_DONOR_BASE_FILTER = f"""
     d.org_rec = 'N'
@@ -1769,17 +1140,11 @@ def load_individual_donor_metrics(
     def execute_query(query: str, name: str) -> list:
         """Execute a single query and track debug info."""
         try:
-            url = f"{DONORPERFECT_BASE_URL}?apikey={DONORPERFECT_API_KEY}&action={quote(query)}"
-            response = requests.get(url, timeout=120)
+            url = f"{DONORPERFECT_BASE_URL}?apikey={DONORPERFECT_API_KEY}&action={_donorperfect_action(query)}"
+            response = get_donorperfect_session().get(url, timeout=120)
             response.raise_for_status()
 
-            root = ET.fromstring(response.content)
-            records = []
-            for rec in root.findall('.//record'):
-                record = {}
-                for field in rec.findall('field'):
-                    record[field.get('name')] = field.get('value')
-                records.append(record)
+            records = _parse_donorperfect_records(response.content)
 
             debug_info['queries'].append({'name': name, 'records': len(records)})
             return records
@@ -1995,7 +1360,8 @@ def load_donor_metrics_by_type(
     prior_start: str,
     prior_end: str,
     base_filter: str,
-    type_name: str
+    type_name: str,
+    include_grant_count: bool = False
 ) -> dict:
     """Load donor metrics from DonorPerfect for a specific donor type.
 
@@ -2006,6 +1372,8 @@ def load_donor_metrics_by_type(
         prior_end: End date of prior period (YYYY-MM-DD)
         base_filter: SQL filter for donor type (e.g., INDIVIDUAL_DONOR_BASE_FILTER)
         type_name: Name of donor type for debug logging
+        include_grant_count: Also count current-period grant gifts (all donors) in the
+            totals query, saving a separate round trip
 
     Returns:
         Dictionary with metrics for both periods
@@ -2014,16 +1382,10 @@ def load_donor_metrics_by_type(
 
     def execute_query(query: str, name: str) -> list:
         try:
-            url = f"{DONORPERFECT_BASE_URL}?apikey={DONORPERFECT_API_KEY}&action={quote(query)}"
-            response = requests.get(url, timeout=120)
+            url = f"{DONORPERFECT_BASE_URL}?apikey={DONORPERFECT_API_KEY}&action={_donorperfect_action(query)}"
+            response = get_donorperfect_session().get(url, timeout=120)
             response.raise_for_status()
-            root = ET.fromstring(response.content)
-            records = []
-            for rec in root.findall('.//record'):
-                record = {}
-                for field in rec.findall('field'):
-                    record[field.get('name')] = field.get('value')
-                records.append(record)
+            records = _parse_donorperfect_records(response.content)
             debug_info['queries'].append({'name': name, 'records': len(records)})
             return records
         except Exception as e:
@@ -2049,8 +1411,13 @@ def load_donor_metrics_by_type(
     prior_prior_start = (prior_start_dt - relativedelta(years=1)).strftime('%Y-%m-%d')
     prior_prior_end = (prior_end_dt - relativedelta(years=1)).strftime('%Y-%m-%d')
 
+    # Grant gifts counted via a scalar subquery so they ride along with the totals query
+    grant_count_select = ""
+    if include_grant_count:
+        grant_count_select = f", (SELECT COUNT(*) FROM dpgift WHERE gift_date BETWEEN {_sql_date(current_start)} AND {_sql_date(current_end)} AND gl_code IN ({GRANT_GL_CODES_SQL})) as grant_count"
+
     # CURRENT PERIOD QUERIES
-    r1_curr = execute_query(f"SELECT SUM(g.amount) as total_revenue, COUNT(*) as gift_count, MAX(g.amount) as largest_gift FROM dpgift g INNER JOIN dp d ON g.donor_id = d.donor_id WHERE g.gift_date BETWEEN '{current_start}' AND '{current_end}' AND {base_filter}", f'{type_name}_curr_totals')
+    r1_curr = execute_query(f"SELECT SUM(g.amount) as total_revenue, COUNT(*) as gift_count, MAX(g.amount) as largest_gift{grant_count_select} FROM dpgift g INNER JOIN dp d ON g.donor_id = d.donor_id WHERE g.gift_date BETWEEN '{current_start}' AND '{current_end}' AND {base_filter}", f'{type_name}_curr_totals')
     r2_curr = execute_query(f"SELECT COUNT(DISTINCT g.donor_id) as new_donors, SUM(g.amount) as new_donor_amount FROM dpgift g INNER JOIN dp d ON g.donor_id = d.donor_id WHERE g.gift_date BETWEEN '{current_start}' AND '{current_end}' AND {base_filter} AND NOT EXISTS (SELECT 1 FROM dpgift g2 WHERE g2.donor_id = g.donor_id AND g2.gift_date < '{current_start}')", f'{type_name}_curr_new')
     r3_curr = execute_query(f"SELECT COUNT(DISTINCT g.donor_id) as reactivated_donors, SUM(g.amount) as reactivated_amount FROM dpgift g INNER JOIN dp d ON g.donor_id = d.donor_id WHERE g.gift_date BETWEEN '{current_start}' AND '{current_end}' AND {base_filter} AND NOT EXISTS (SELECT 1 FROM dpgift g2 WHERE g2.donor_id = g.donor_id AND g2.gift_date BETWEEN '{prior_start}' AND '{prior_end}') AND EXISTS (SELECT 1 FROM dpgift g3 WHERE g3.donor_id = g.donor_id AND g3.gift_date < '{prior_start}')", f'{type_name}_curr_react')
     r4_curr = execute_query(f"SELECT COUNT(DISTINCT curr.donor_id) as upgraded_donors, SUM(curr.total) as upgrade_revenue FROM (SELECT g.donor_id, SUM(g.amount) as total FROM dpgift g INNER JOIN dp d ON g.donor_id = d.donor_id WHERE g.gift_date BETWEEN '{current_start}' AND '{current_end}' AND {base_filter} GROUP BY g.donor_id) curr INNER JOIN (SELECT g.donor_id, SUM(g.amount) as total FROM dpgift g INNER JOIN dp d ON g.donor_id = d.donor_id WHERE g.gift_date BETWEEN '{prior_start}' AND '{prior_end}' AND {base_filter} GROUP BY g.donor_id) prev ON curr.donor_id = prev.donor_id WHERE curr.total > prev.total", f'{type_name}_curr_up')
@@ -2079,22 +1446,26 @@ def load_donor_metrics_by_type(
     prior_same = r5_prior[0] if r5_prior else {}
     prior_down = r6_prior[0] if r6_prior else {}
 
+    current = {
+        'total_revenue': safe_float(curr_totals.get('total_revenue')),
+        'gift_count': safe_int(curr_totals.get('gift_count')),
+        'largest_gift': safe_float(curr_totals.get('largest_gift')),
+        'new_donors': safe_int(curr_new.get('new_donors')),
+        'new_donor_amount': safe_float(curr_new.get('new_donor_amount')),
+        'reactivated_donors': safe_int(curr_react.get('reactivated_donors')),
+        'reactivated_amount': safe_float(curr_react.get('reactivated_amount')),
+        'upgraded_donors': safe_int(curr_up.get('upgraded_donors')),
+        'upgrade_revenue': safe_float(curr_up.get('upgrade_revenue')),
+        'same_donors': safe_int(curr_same.get('same_donors')),
+        'same_revenue': safe_float(curr_same.get('same_revenue')),
+        'downgraded_donors': safe_int(curr_down.get('downgraded_donors')),
+        'downgrade_revenue': safe_float(curr_down.get('downgrade_revenue')),
+    }
+    if include_grant_count:
+        current['grant_count'] = safe_int(curr_totals.get('grant_count'))
+
     return {
-        'current': {
-            'total_revenue': safe_float(curr_totals.get('total_revenue')),
-            'gift_count': safe_int(curr_totals.get('gift_count')),
-            'largest_gift': safe_float(curr_totals.get('largest_gift')),
-            'new_donors': safe_int(curr_new.get('new_donors')),
-            'new_donor_amount': safe_float(curr_new.get('new_donor_amount')),
-            'reactivated_donors': safe_int(curr_react.get('reactivated_donors')),
-            'reactivated_amount': safe_float(curr_react.get('reactivated_amount')),
-            'upgraded_donors': safe_int(curr_up.get('upgraded_donors')),
-            'upgrade_revenue': safe_float(curr_up.get('upgrade_revenue')),
-            'same_donors': safe_int(curr_same.get('same_donors')),
-            'same_revenue': safe_float(curr_same.get('same_revenue')),
-            'downgraded_donors': safe_int(curr_down.get('downgraded_donors')),
-            'downgrade_revenue': safe_float(curr_down.get('downgrade_revenue')),
-        },
+        'current': current,
         'prior': {
             'total_revenue': safe_float(prior_totals.get('total_revenue')),
             'gift_count': safe_int(prior_totals.get('gift_count')),
@@ -2136,9 +1507,10 @@ def get_donor_comparison_metrics() -> dict:
     prior_label = fy_info['prior_fy_short']
 
     # Load metrics for each donor type
+    # Grant count (all donors) is piggybacked on the individuals totals query
     individuals = load_donor_metrics_by_type(
         current_fy_start, current_fy_end, prior_fy_start, prior_fy_end,
-        INDIVIDUAL_DONOR_BASE_FILTER, 'individual'
+        INDIVIDUAL_DONOR_BASE_FILTER, 'individual', include_grant_count=True
     )
 
     organizations = load_donor_metrics_by_type(
@@ -2165,6 +1537,7 @@ def get_donor_comparison_metrics() -> dict:
         }
 
     total_current = sum_metrics(individuals['current'], organizations['current'])
+    total_current['grant_count'] = individuals['current'].get('grant_count', 0)
     total_prior = sum_metrics(individuals['prior'], organizations['prior'])
 
     return {
@@ -2218,19 +1591,11 @@ def normalize_legacy_record(record: dict) -> dict:
     """Normalize a legacy record, keeping original field names for DataProcessor."""
     normalized = {}
 
-    # Copy passthrough fields as-is (DataProcessor handles these natively)
-    for field in LEGACY_PASSTHROUGH_FIELDS:
-        if field in record:
-            value = record[field]
-            # Handle list values (Fusioo sometimes returns single values as lists)
-            if isinstance(value, list) and len(value) == 1:
-                value = value[0]
-            normalized[field] = value
-
-    # Map fields that need renaming
-    for legacy_field, current_field in LEGACY_FIELD_MAP.items():
+    # Copy passthrough fields as-is and map fields that need renaming in one pass
+    for legacy_field, current_field in _LEGACY_FIELD_PAIRS:
         if legacy_field in record:
             value = record[legacy_field]
+            # Handle list values (Fusioo sometimes returns single values as lists)
             if isinstance(value, list) and len(value) == 1:
                 value = value[0]
             normalized[current_field] = value
@@ -2263,21 +1628,28 @@ def combine_activity_data(current_records: list, legacy_records: list, cutoff_da
     combined = list(current_records)  # Start with current data
     cutoff = datetime.strptime(cutoff_date, "%Y-%m-%d")
 
-    for record in legacy_records:
-        # Normalize the legacy record to current format
-        normalized = normalize_legacy_record(record)
+    # IDs already present in the current table (migrated records may appear in both)
+    seen = {r.get("_id") or r.get("id") for r in current_records}
+    seen -= {None, ""}
 
-        # Parse the date to filter only pre-cutoff data
-        # After normalization, date is mapped to date_of_activity
-        date_val = normalized.get("date_of_activity", "")
+    for record in legacy_records:
+        # Skip legacy records that were migrated into the current table
+        if (record.get("_id") or record.get("id")) in seen:
+            continue
+
+        # Parse the date first to filter only pre-cutoff data, so later records are
+        # never normalized (legacy "date" is mapped to date_of_activity)
+        date_val = record.get("date", "")
+        if isinstance(date_val, list) and len(date_val) == 1:
+            date_val = date_val[0]
         if isinstance(date_val, str) and date_val:
             # Handle Fusioo date format (may include timestamp after |)
             date_str = date_val.split("|")[0] if "|" in date_val else date_val
             try:
                 record_date = datetime.strptime(date_str, "%Y-%m-%d")
-                # Only include legacy records before the cutoff date
+                # Only include legacy records before the cutoff date, normalized to current format
                 if record_date < cutoff:
-                    combined.append(normalized)
+                    combined.append(normalize_legacy_record(record))
             except ValueError:
                 # If date parsing fails, skip this record
                 continue
@@ -2319,21 +1691,9 @@ def render_hero_header(processor: DataProcessor, activity_records: list = None,
                 except (ValueError, TypeError):
                     pass
 
-        # Filter activity records by date range and collect low income percentages
-        low_income_values = []
-        for record in activity_records:
-            # Check date range
-            record_date = record.get('date_of_activity') or record.get('date')
-            if record_date:
-                try:
-                    record_dt = pd.to_datetime(record_date)
-                    if not (pd.Timestamp(start_date) <= record_dt <= pd.Timestamp(end_date)):
-                        continue
-                except:
-                    continue
-            else:
-                continue
-
+        # Filter activity records by date range and accumulate low income percentages
+        low_income_total, low_income_count = 0.0, 0
+        for record in _filter_records_by_date(activity_records, start_date, end_date):
             # For legacy records, use percentage_low_income directly from the record
             if record.get('_is_legacy'):
                 pct = record.get('percentage_low_income')
@@ -2342,7 +1702,8 @@ def render_hero_header(processor: DataProcessor, activity_records: list = None,
                         if isinstance(pct, list):
                             pct = pct[0] if pct else None
                         if pct is not None:
-                            low_income_values.append(float(pct))
+                            low_income_total += float(pct)
+                            low_income_count += 1
                     except (ValueError, TypeError):
                         pass
                 continue
@@ -2352,11 +1713,12 @@ def render_hero_header(processor: DataProcessor, activity_records: list = None,
             if isinstance(partner_id, list):
                 partner_id = partner_id[0] if partner_id else ''
             if partner_id and partner_id in partner_low_income:
-                low_income_values.append(partner_low_income[partner_id])
+                low_income_total += partner_low_income[partner_id]
+                low_income_count += 1
 
         # Calculate average
-        if low_income_values:
-            low_income_pct = sum(low_income_values) / len(low_income_values)
+        if low_income_count:
+            low_income_pct = low_income_total / low_income_count
 
     # Get current fiscal year for display
     fy_info = get_fiscal_year_info(date.today())
@@ -2415,97 +1777,193 @@ def render_hero_header(processor: DataProcessor, activity_records: list = None,
         books_pct = (books / books_goal * 100) if books_goal > 0 else 0
         display_pct = min(books_pct, 100)
         remaining_pct = max(100 - display_pct, 0)
-        fig = go.Figure(data=[go.Pie(
-            values=[display_pct, remaining_pct],
-            hole=0.7,
-            marker=dict(colors=['#3b82f6', '#e2e8f0']),
-            textinfo='none',
-            hoverinfo='skip',
-            sort=False
-        )])
-        fig.update_layout(
-            showlegend=False,
-            margin=dict(t=20, b=20, l=10, r=10),
-            height=180,
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            annotations=[
-                dict(
-                    text=f"<b>{books:,}</b>",
-                    x=0.5, y=0.55,
-                    font=dict(size=18, color='#1a365d', family='system-ui'),
-                    showarrow=False
-                ),
-                dict(
-                    text=f"{books_pct:.0f}% of goal",
-                    x=0.5, y=0.38,
-                    font=dict(size=10, color='#64748b', family='system-ui'),
-                    showarrow=False
-                )
-            ]
+        fig = go.Figure(
+            data=[go.Pie(
+                values=[display_pct, remaining_pct],
+                hole=0.7,
+                marker=dict(colors=['#3b82f6', '#e2e8f0']),
+                textinfo='none',
+                hoverinfo='skip',
+                sort=False
+            )],
+            layout=go.Layout(
+                showlegend=False,
+                margin=dict(t=20, b=20, l=10, r=10),
+                height=180,
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                annotations=[
+                    dict(
+                        text=f"<b>{books:,}</b>",
+                        x=0.5, y=0.55,
+                        font=dict(size=18, color='#1a365d', family='system-ui'),
+                        showarrow=False
+                    ),
+                    dict(
+                        text=f"{books_pct:.0f}% of goal",
+                        x=0.5, y=0.38,
+                        font=dict(size=10, color='#64748b', family='system-ui'),
+                        showarrow=False
+                    )
+                ]
+            )
         )
         st.plotly_chart(fig, use_container_width=True, key="hero_books_ring")
         st.markdown(f"<p style='text-align: center; margin-top: -15px; color: #1a365d; font-size: 0.85rem; font-weight: 700;'>Goal: {books_goal:,}</p>", unsafe_allow_html=True)
 
-    # Children Served Ring
-    with col2:
-        st.markdown("<p style='text-align: center; font-weight: 600; color: #1a365d; font-size: 0.9rem; margin-bottom: -10px;'>👶 Children Served</p>", unsafe_allow_html=True)
-        children_pct = (children / children_goal * 100) if children_goal > 0 else 0
-        display_pct = min(children_pct, 100)
-        remaining_pct = max(100 - display_pct, 0)
-        fig = go.Figure(data=[go.Pie(
-            values=[display_pct, remaining_pct],
-            hole=0.7,
-            marker=dict(colors=['#10b981', '#e2e8f0']),
-            textinfo='none',
-            hoverinfo='skip',
-            sort=False
-        )])
-        fig.update_layout(
-            showlegend=False,
-            margin=dict(t=20, b=20, l=10, r=10),
-            height=180,
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            annotations=[
-                dict(
-                    text=f"<b>{children:,}</b>",
-                    x=0.5, y=0.55,
-                    font=dict(size=18, color='#1a365d', family='system-ui'),
-                    showarrow=False
-                ),
-                dict(
-                    text=f"{children_pct:.0f}% of goal",
-                    x=0.5, y=0.38,
-                    font=dict(size=10, color='#64748b', family='system-ui'),
-                    showarrow=False
-                )
-            ]
-        )
-        st.plotly_chart(fig, use_container_width=True, key="hero_children_ring")
-        st.markdown(f"<p style='text-align: center; margin-top: -15px; color: #1a365d; font-size: 0.85rem; font-weight: 700;'>Goal: {children_goal:,}</p>", unsafe_allow_html=True)
+    # Children Served Ring
+    with col2:
+        st.markdown("<p style='text-align: center; font-weight: 600; color: #1a365d; font-size: 0.9rem; margin-bottom: -10px;'>👶 Children Served</p>", unsafe_allow_html=True)
+        children_pct = (children / children_goal * 100) if children_goal > 0 else 0
+        display_pct = min(children_pct, 100)
+        remaining_pct = max(100 - display_pct, 0)
+        fig = go.Figure(
+            data=[go.Pie(
+                values=[display_pct, remaining_pct],
+                hole=0.7,
+                marker=dict(colors=['#10b981', '#e2e8f0']),
+                textinfo='none',
+                hoverinfo='skip',
+                sort=False
+            )],
+            layout=go.Layout(
+                showlegend=False,
+                margin=dict(t=20, b=20, l=10, r=10),
+                height=180,
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                annotations=[
+                    dict(
+                        text=f"<b>{children:,}</b>",
+                        x=0.5, y=0.55,
+                        font=dict(size=18, color='#1a365d', family='system-ui'),
+                        showarrow=False
+                    ),
+                    dict(
+                        text=f"{children_pct:.0f}% of goal",
+                        x=0.5, y=0.38,
+                        font=dict(size=10, color='#64748b', family='system-ui'),
+                        showarrow=False
+                    )
+                ]
+            )
+        )
+        st.plotly_chart(fig, use_container_width=True, key="hero_children_ring")
+        st.markdown(f"<p style='text-align: center; margin-top: -15px; color: #1a365d; font-size: 0.85rem; font-weight: 700;'>Goal: {children_goal:,}</p>", unsafe_allow_html=True)
+
+    # Low Income % - styled box
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card" style="text-align: center; padding: 1.25rem; height: 180px; display: flex; flex-direction: column; justify-content: center;">
+            <div style="font-size: 0.85rem; color: #718096; margin-bottom: 0.5rem;">📊 % in Low Income Settings</div>
+            <div style="font-size: 1.75rem; font-weight: 700; color: #1a365d;">{low_income_pct:.1f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Parents/Caregivers - styled box
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card" style="text-align: center; padding: 1.25rem; height: 180px; display: flex; flex-direction: column; justify-content: center;">
+            <div style="font-size: 0.85rem; color: #718096; margin-bottom: 0.5rem;">👨‍👩‍👧 Parents/Caregivers</div>
+            <div style="font-size: 1.75rem; font-weight: 700; color: #1a365d;">{parents:,}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+@st.cache_data(ttl=3600)  # Cache for 1 hour (footer shows today's date)
+def _build_snapshot_html(start_date: date, end_date: date, books: int, children: int, avg_books: float, parents: int,
+                         total_views: int, digital_views: int, newsletter_views: int,
+                         total_books_count: int, completed_books: int, in_progress_books: int, bilingual_books: int,
+                         goal1_progress: float, goal2_progress: float, goal3_progress: float, goal4_progress: float) -> str:
+    """Build the print snapshot HTML (cached on the computed metrics)."""
+    date_str = f"{start_date.strftime('%B %d, %Y')} - {end_date.strftime('%B %d, %Y')}"
+    today_str = date.today().strftime('%B %d, %Y')
+
+    html = f'''
+    <div class="snapshot-container">
+        <div class="snapshot-header">
+            <h2 class="snapshot-title">📚 BookSpring Strategic Goals Snapshot</h2>
+            <p class="snapshot-date">{date_str}</p>
+            <p class="snapshot-summary">
+                <strong>{books:,}</strong> Books &nbsp;|&nbsp;
+                <strong>{children:,}</strong> Children &nbsp;|&nbsp;
+                <strong>{avg_books:.2f}</strong> Books/Child
+            </p>
+        </div>
+
+        <div class="goals-grid">
+            <div class="goal-card goal-card-g1">
+                <div class="goal-title">🎯 Goal 1: Strengthen Impact</div>
+                <div class="metrics-row">
+                    <div class="metric-box"><div class="metric-val">{avg_books:.2f}</div><div class="metric-lbl">Books/Child</div></div>
+                    <div class="metric-box"><div class="metric-val">4.0</div><div class="metric-lbl">Target</div></div>
+                    <div class="metric-box"><div class="metric-val">{books:,}</div><div class="metric-lbl">Books</div></div>
+                    <div class="metric-box"><div class="metric-val">{children:,}</div><div class="metric-lbl">Children</div></div>
+                </div>
+                <div class="progress-wrap">
+                    <div class="progress-bg"><div class="progress-fill-g1" style="height:100%;width:{goal1_progress:.0f}%;border-radius:100px;"></div></div>
+                    <div class="progress-txt">{goal1_progress:.1f}% toward target</div>
+                </div>
+            </div>
+
+            <div class="goal-card goal-card-g2">
+                <div class="goal-title">💡 Goal 2: Inspire Engagement</div>
+                <div class="metrics-row">
+                    <div class="metric-box"><div class="metric-val">{total_views:,}</div><div class="metric-lbl">Total Views</div></div>
+                    <div class="metric-box"><div class="metric-val">{digital_views:,}</div><div class="metric-lbl">Digital</div></div>
+                    <div class="metric-box"><div class="metric-val">{newsletter_views:,}</div><div class="metric-lbl">Newsletter</div></div>
+                    <div class="metric-box"><div class="metric-val">1.5M</div><div class="metric-lbl">Target</div></div>
+                </div>
+                <div class="progress-wrap">
+                    <div class="progress-bg"><div class="progress-fill-g2" style="height:100%;width:{goal2_progress:.0f}%;border-radius:100px;"></div></div>
+                    <div class="progress-txt">{goal2_progress:.1f}% toward target</div>
+                </div>
+            </div>
+
+            <div class="goal-card goal-card-g3">
+                <div class="goal-title">🚀 Goal 3: Advance Innovation</div>
+                <div class="metrics-row">
+                    <div class="metric-box"><div class="metric-val">{total_books_count}</div><div class="metric-lbl">Total</div></div>
+                    <div class="metric-box"><div class="metric-val">{completed_books}</div><div class="metric-lbl">Complete</div></div>
+                    <div class="metric-box"><div class="metric-val">{in_progress_books}</div><div class="metric-lbl">In Progress</div></div>
+                    <div class="metric-box"><div class="metric-val">{bilingual_books}</div><div class="metric-lbl">Bilingual</div></div>
+                </div>
+                <div class="progress-wrap">
+                    <div class="progress-bg"><div class="progress-fill-g3" style="height:100%;width:{goal3_progress:.0f}%;border-radius:100px;"></div></div>
+                    <div class="progress-txt">{completed_books}/{total_books_count} completed</div>
+                </div>
+            </div>
 
-    # Low Income % - styled box
-    with col3:
-        st.markdown(f"""
-        <div class="metric-card" style="text-align: center; padding: 1.25rem; height: 180px; display: flex; flex-direction: column; justify-content: center;">
-            <div style="font-size: 0.85rem; color: #718096; margin-bottom: 0.5rem;">📊 % in Low Income Settings</div>
-            <div style="font-size: 1.75rem; font-weight: 700; color: #1a365d;">{low_income_pct:.1f}%</div>
+            <div class="goal-card goal-card-g4">
+                <div class="goal-title">🌱 Goal 4: Optimize Sustainability</div>
+                <div class="metrics-row">
+                    <div class="metric-box"><div class="metric-val">{books:,}</div><div class="metric-lbl">Distributed</div></div>
+                    <div class="metric-box"><div class="metric-val">600K</div><div class="metric-lbl">Target/Yr</div></div>
+                    <div class="metric-box"><div class="metric-val">{parents:,}</div><div class="metric-lbl">Caregivers</div></div>
+                    <div class="metric-box"><div class="metric-val">$3M</div><div class="metric-lbl">Budget</div></div>
+                </div>
+                <div class="progress-wrap">
+                    <div class="progress-bg"><div class="progress-fill-g4" style="height:100%;width:{goal4_progress:.0f}%;border-radius:100px;"></div></div>
+                    <div class="progress-txt">{goal4_progress:.1f}% toward target</div>
+                </div>
+            </div>
         </div>
-        """, unsafe_allow_html=True)
 
-    # Parents/Caregivers - styled box
-    with col4:
-        st.markdown(f"""
-        <div class="metric-card" style="text-align: center; padding: 1.25rem; height: 180px; display: flex; flex-direction: column; justify-content: center;">
-            <div style="font-size: 0.85rem; color: #718096; margin-bottom: 0.5rem;">👨‍👩‍👧 Parents/Caregivers</div>
-            <div style="font-size: 1.75rem; font-weight: 700; color: #1a365d;">{parents:,}</div>
-        </div>
-        """, unsafe_allow_html=True)
+        <div class="snapshot-footer">Generated on {today_str} • BookSpring Strategic Dashboard</div>
+    </div>
+    '''
+
+    return html
 
 
 def render_print_snapshot(processor: DataProcessor, views_data: list, books_data: list, start_date: date, end_date: date):
     """Render the one-page print snapshot of all four goals."""
+    # Only build the snapshot once the user has asked for it
+    if not st.session_state.get('show_snapshot'):
+        if not st.button("🖨️ Show Print Snapshot", key="show_snapshot_btn"):
+            return
+        st.session_state['show_snapshot'] = True
+
     stats = processor.get_summary_stats()
     # Use _books_distributed_all for total (includes books to previously served children)
     books = int(stats.get("totals", {}).get("_books_distributed_all", 0) or stats.get("totals", {}).get("_of_books_distributed", 0))
@@ -2522,23 +1980,17 @@ def render_print_snapshot(processor: DataProcessor, views_data: list, books_data
     digital_views = 0
     newsletter_views = 0
     if views_data:
-        df = pd.DataFrame(views_data)
-        for col in df.columns:
-            if df[col].apply(lambda x: isinstance(x, list)).any():
-                df[col] = df[col].apply(lambda x: x[0] if isinstance(x, list) and len(x) == 1 else x)
+        df = _unwrap_singleton_lists(pd.DataFrame(views_data))
 
         if "date" in df.columns:
-            df["_parsed_date"] = df["date"].apply(lambda x: x.split("|")[0] if isinstance(x, str) and "|" in x else x)
-            df["_parsed_date"] = pd.to_datetime(df["_parsed_date"], errors='coerce')
-            mask = (df["_parsed_date"] >= pd.Timestamp(start_date)) & (df["_parsed_date"] <= pd.Timestamp(end_date))
-            df = df[mask]
+            # Fusioo dates are "YYYY-MM-DD" optionally followed by "|time"; slice the fixed-width date part
+            df["_parsed_date"] = pd.to_datetime(df["date"].astype(str).str[:10], format='%Y-%m-%d', errors='coerce')
+            df = df[_mask_range(df["_parsed_date"], start_date, end_date)]
 
         if "total_digital_views" in df.columns:
-            df["total_digital_views"] = pd.to_numeric(df["total_digital_views"], errors='coerce').fillna(0)
-            digital_views = int(df["total_digital_views"].sum())
+            digital_views = int(np.nansum(pd.to_numeric(df["total_digital_views"], errors='coerce').to_numpy(dtype=np.float64)))
         if "total_newsletter_views" in df.columns:
-            df["total_newsletter_views"] = pd.to_numeric(df["total_newsletter_views"], errors='coerce').fillna(0)
-            newsletter_views = int(df["total_newsletter_views"].sum())
+            newsletter_views = int(np.nansum(pd.to_numeric(df["total_newsletter_views"], errors='coerce').to_numpy(dtype=np.float64)))
         total_views = digital_views + newsletter_views
 
     target_views = 1_500_000
@@ -2550,10 +2002,7 @@ def render_print_snapshot(processor: DataProcessor, views_data: list, books_data
     in_progress_books = 0
     bilingual_books = 0
     if books_data:
-        bdf = pd.DataFrame(books_data)
-        for col in bdf.columns:
-            if bdf[col].apply(lambda x: isinstance(x, list)).any():
-                bdf[col] = bdf[col].apply(lambda x: x[0] if isinstance(x, list) and len(x) == 1 else x)
+        bdf = _unwrap_singleton_lists(pd.DataFrame(books_data))
         total_books_count = len(bdf)
         if "status" in bdf.columns:
             completed_books = len(bdf[bdf["status"].str.contains("Complete|Published", case=False, na=False)])
@@ -2674,84 +2123,12 @@ def render_print_snapshot(processor: DataProcessor, views_data: list, books_data
     </style>
     """, unsafe_allow_html=True)
 
-    # Build HTML with simple string formatting (no f-string style variables)
-    date_str = f"{start_date.strftime('%B %d, %Y')} - {end_date.strftime('%B %d, %Y')}"
-    today_str = date.today().strftime('%B %d, %Y')
-
-    html = f'''
-    <div class="snapshot-container">
-        <div class="snapshot-header">
-            <h2 class="snapshot-title">📚 BookSpring Strategic Goals Snapshot</h2>
-            <p class="snapshot-date">{date_str}</p>
-            <p class="snapshot-summary">
-                <strong>{books:,}</strong> Books &nbsp;|&nbsp;
-                <strong>{children:,}</strong> Children &nbsp;|&nbsp;
-                <strong>{avg_books:.2f}</strong> Books/Child
-            </p>
-        </div>
-
-        <div class="goals-grid">
-            <div class="goal-card goal-card-g1">
-                <div class="goal-title">🎯 Goal 1: Strengthen Impact</div>
-                <div class="metrics-row">
-                    <div class="metric-box"><div class="metric-val">{avg_books:.2f}</div><div class="metric-lbl">Books/Child</div></div>
-                    <div class="metric-box"><div class="metric-val">4.0</div><div class="metric-lbl">Target</div></div>
-                    <div class="metric-box"><div class="metric-val">{books:,}</div><div class="metric-lbl">Books</div></div>
-                    <div class="metric-box"><div class="metric-val">{children:,}</div><div class="metric-lbl">Children</div></div>
-                </div>
-                <div class="progress-wrap">
-                    <div class="progress-bg"><div class="progress-fill-g1" style="height:100%;width:{goal1_progress:.0f}%;border-radius:100px;"></div></div>
-                    <div class="progress-txt">{goal1_progress:.1f}% toward target</div>
-                </div>
-            </div>
-
-            <div class="goal-card goal-card-g2">
-                <div class="goal-title">💡 Goal 2: Inspire Engagement</div>
-                <div class="metrics-row">
-                    <div class="metric-box"><div class="metric-val">{total_views:,}</div><div class="metric-lbl">Total Views</div></div>
-                    <div class="metric-box"><div class="metric-val">{digital_views:,}</div><div class="metric-lbl">Digital</div></div>
-                    <div class="metric-box"><div class="metric-val">{newsletter_views:,}</div><div class="metric-lbl">Newsletter</div></div>
-                    <div class="metric-box"><div class="metric-val">1.5M</div><div class="metric-lbl">Target</div></div>
-                </div>
-                <div class="progress-wrap">
-                    <div class="progress-bg"><div class="progress-fill-g2" style="height:100%;width:{goal2_progress:.0f}%;border-radius:100px;"></div></div>
-                    <div class="progress-txt">{goal2_progress:.1f}% toward target</div>
-                </div>
-            </div>
-
-            <div class="goal-card goal-card-g3">
-                <div class="goal-title">🚀 Goal 3: Advance Innovation</div>
-                <div class="metrics-row">
-                    <div class="metric-box"><div class="metric-val">{total_books_count}</div><div class="metric-lbl">Total</div></div>
-                    <div class="metric-box"><div class="metric-val">{completed_books}</div><div class="metric-lbl">Complete</div></div>
-                    <div class="metric-box"><div class="metric-val">{in_progress_books}</div><div class="metric-lbl">In Progress</div></div>
-                    <div class="metric-box"><div class="metric-val">{bilingual_books}</div><div class="metric-lbl">Bilingual</div></div>
-                </div>
-                <div class="progress-wrap">
-                    <div class="progress-bg"><div class="progress-fill-g3" style="height:100%;width:{goal3_progress:.0f}%;border-radius:100px;"></div></div>
-                    <div class="progress-txt">{completed_books}/{total_books_count} completed</div>
-                </div>
-            </div>
-
-            <div class="goal-card goal-card-g4">
-                <div class="goal-title">🌱 Goal 4: Optimize Sustainability</div>
-                <div class="metrics-row">
-                    <div class="metric-box"><div class="metric-val">{books:,}</div><div class="metric-lbl">Distributed</div></div>
-                    <div class="metric-box"><div class="metric-val">600K</div><div class="metric-lbl">Target/Yr</div></div>
-                    <div class="metric-box"><div class="metric-val">{parents:,}</div><div class="metric-lbl">Caregivers</div></div>
-                    <div class="metric-box"><div class="metric-val">$3M</div><div class="metric-lbl">Budget</div></div>
-                </div>
-                <div class="progress-wrap">
-                    <div class="progress-bg"><div class="progress-fill-g4" style="height:100%;width:{goal4_progress:.0f}%;border-radius:100px;"></div></div>
-                    <div class="progress-txt">{goal4_progress:.1f}% toward target</div>
-                </div>
-            </div>
-        </div>
-
-        <div class="snapshot-footer">Generated on {today_str} • BookSpring Strategic Dashboard</div>
-    </div>
-    '''
-
+    html = _build_snapshot_html(
+        start_date, end_date, books, children, avg_books, parents,
+        total_views, digital_views, newsletter_views,
+        total_books_count, completed_books, in_progress_books, bilingual_books,
+        goal1_progress, goal2_progress, goal3_progress, goal4_progress,
+    )
     st.markdown(html, unsafe_allow_html=True)
 
 
@@ -2791,34 +2168,36 @@ def render_goal1_strengthen_impact(processor: DataProcessor, time_unit: str):
         # Create progress ring
         display_pct = min(pct, 100)
         remaining_pct = max(100 - display_pct, 0)
-        fig = go.Figure(data=[go.Pie(
-            values=[display_pct, remaining_pct],
-            hole=0.7,
-            marker=dict(colors=['#667eea', '#e2e8f0']),
-            textinfo='none',
-            hoverinfo='skip',
-            sort=False
-        )])
-        fig.update_layout(
-            showlegend=False,
-            margin=dict(t=30, b=30, l=10, r=10),
-            height=230,
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            annotations=[
-                dict(
-                    text=f"<b>{avg_overall:.2f}</b>",
-                    x=0.5, y=0.55,
-                    font=dict(size=24, color='#1a365d', family='system-ui'),
-                    showarrow=False
-                ),
-                dict(
-                    text=f"{pct:.0f}% of goal",
-                    x=0.5, y=0.38,
-                    font=dict(size=12, color='#64748b', family='system-ui'),
-                    showarrow=False
-                )
-            ]
+        fig = go.Figure(
+            data=[go.Pie(
+                values=[display_pct, remaining_pct],
+                hole=0.7,
+                marker=dict(colors=['#667eea', '#e2e8f0']),
+                textinfo='none',
+                hoverinfo='skip',
+                sort=False
+            )],
+            layout=go.Layout(
+                showlegend=False,
+                margin=dict(t=30, b=30, l=10, r=10),
+                height=230,
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                annotations=[
+                    dict(
+                        text=f"<b>{avg_overall:.2f}</b>",
+                        x=0.5, y=0.55,
+                        font=dict(size=24, color='#1a365d', family='system-ui'),
+                        showarrow=False
+                    ),
+                    dict(
+                        text=f"{pct:.0f}% of goal",
+                        x=0.5, y=0.38,
+                        font=dict(size=12, color='#64748b', family='system-ui'),
+                        showarrow=False
+                    )
+                ]
+            )
         )
         st.plotly_chart(fig, use_container_width=True, key="goal1_ring")
         st.markdown(f"<p style='text-align: center; margin-top: -20px; color: #1a365d; font-size: 0.9rem; font-weight: 700;'>2030 Target: 4.0 books/child</p>", unsafe_allow_html=True)
@@ -2872,14 +2251,12 @@ def render_goal1_strengthen_impact(processor: DataProcessor, time_unit: str):
             rename_map = {c: short_names.get(c, c) for c in trend_df.columns if c != "period"}
             trend_df = trend_df.rename(columns=rename_map)
 
-            # Better color palette for age groups
-            age_colors = ["#3b82f6", "#10b981", "#f59e0b", "#8b5cf6", "#ef4444"]
             fig = px.line(
                 trend_df,
                 x="period",
                 y=[short_names.get(m, m) for m in available_age],
                 markers=True,
-                color_discrete_sequence=age_colors
+                color_discrete_sequence=_AGE_GROUP_COLORS
             )
             fig.add_hline(y=4.0, line_dash="dash", line_color="#22c55e",
                          annotation_text="Target", annotation_font_color="#22c55e")
@@ -2905,6 +2282,147 @@ def render_goal1_strengthen_impact(processor: DataProcessor, time_unit: str):
     st.markdown("<p style='font-size: 0.85rem; color: #718096; text-decoration: underline; text-align: center;'> Trends include all books and all children per period (including previously served).</p>", unsafe_allow_html=True)
 
 
+@st.cache_data(ttl=86400)  # Cache for 24 hours
+def compute_partner_metrics(activity_records: list, partners_data: list, start_date: date, end_date: date) -> tuple:
+    """Compute recurring partners and in-person event partners within a date range.
+
+    Returns:
+        Tuple of (recurring_partners as [(name, count), ...], sorted in-person partner names)
+    """
+    if not activity_records:
+        return [], []
+
+    # Parse all activity dates in one pass and keep only records inside the date range
+    in_range_records = _filter_records_by_date(activity_records, start_date, end_date)
+
+    # Build partner ID to name mapping
+    partner_names = {}
+    if partners_data:
+        pdf = pd.DataFrame(partners_data)
+        empty = pd.Series('', index=pdf.index)
+
+        def first_value(x):
+            return (x[0] if x else '') if isinstance(x, list) else x
+
+        site_names = pdf.get('site_name', empty).map(first_value).fillna('')
+        main_orgs = pdf.get('main_organization_from_list', empty).map(first_value).fillna('')
+
+        # For "Various" partner, use main_organization_from_list instead
+        use_main_org = site_names.str.lower().eq('various') & main_orgs.astype(bool)
+        site_names = site_names.where(~use_main_org, main_orgs)
+
+        ids = pdf.get('id', empty).fillna('')
+        keep = ids.astype(bool) & site_names.astype(bool)
+        partner_names = dict(zip(ids[keep], site_names[keep]))
+
+    # Single pass over in-range records: collect partner occurrences by NAME and
+    # partners of in-person events
+    matched_partner_names = []
+    inperson_event_partners = set()
+    # Bind hot lookups to locals; this loop runs once per activity record
+    lookup_partner = partner_names.get
+    add_match = matched_partner_names.append
+    add_inperson = inperson_event_partners.add
+    inperson_search = _INPERSON_RE.search
+    for record in in_range_records:
+        # Extract partner name based on record type
+        partner_name = None
+        if record.get('_is_legacy'):
+            # Legacy records: extract name from main_partner, site_name_new, or site_name
+            main_partner = record.get('main_partner', '')
+            if isinstance(main_partner, list):
+                main_partner = main_partner[0] if main_partner else ''
+
+            if main_partner and '* Other - See Site Name' not in str(main_partner):
+                partner_name = main_partner
+            else:
+                # Check site_name_new
+                site_name_new = record.get('site_name_new', '')
+                if isinstance(site_name_new, list):
+                    site_name_new = site_name_new[0] if site_name_new else ''
+
+                if site_name_new and '* See Additional Site Names' not in str(site_name_new):
+                    partner_name = site_name_new
+                else:
+                    # Fall back to site_name (not array)
+                    site_name_val = record.get('site_name', '')
+                    if isinstance(site_name_val, list):
+                        site_name_val = site_name_val[0] if site_name_val else ''
+                    if site_name_val:
+                        partner_name = site_name_val
+        else:
+            # Current records: look up partner name from partners table using ID
+            partner_id = record.get('partners_testing', '')
+            if isinstance(partner_id, list):
+                partner_id = partner_id[0] if partner_id else ''
+            if partner_id:
+                partner_name = lookup_partner(partner_id)
+
+        if not partner_name:
+            continue
+        add_match(partner_name)
+
+        # Check if it's an in-person event
+        # Exact type names hit the set; the regex only runs for combined/unexpected values
+        activity_type = record.get('activity_type', '')
+        if isinstance(activity_type, list):
+            # Check elements individually so a match in the first one skips the rest
+            is_inperson = any(x in _INPERSON_TYPES or inperson_search(str(x)) for x in activity_type)
+        else:
+            is_inperson = activity_type in _INPERSON_TYPES or inperson_search(str(activity_type)) is not None
+        if is_inperson:
+            add_inperson(partner_name)
+
+    # Get recurring partners (appeared more than once)
+    recurring_partners = []
+    if partners_data:
+        # Stable sort keeps first-seen order among partners with equal counts
+        name_counts = (
+            pd.Series(matched_partner_names, dtype=object)
+            .value_counts(sort=False)
+            .sort_values(ascending=False, kind='stable')
+        )
+        recurring = name_counts[name_counts > 1]
+        recurring_partners = list(zip(recurring.index, recurring.tolist()))
+
+    return recurring_partners, sorted(inperson_event_partners)
+
+
+@st.cache_data(ttl=86400)  # Cache for 24 hours
+def compute_views_metrics(views_data: list, start_date: date, end_date: date) -> tuple:
+    """Filter content views to a date range and total digital/newsletter views.
+
+    Returns:
+        Tuple of (filtered views DataFrame, digital views, newsletter views)
+    """
+    digital_views = 0
+    newsletter_views = 0
+    df = pd.DataFrame(views_data)
+
+    # Convert list columns
+    for col in df.select_dtypes(include='object').columns:
+        sample = df[col].dropna().head(1)
+        if sample.empty or not isinstance(sample.iloc[0], list):
+            continue
+        df[col] = _flatten_listcol(df[col])
+
+    # Parse and filter by date
+    if "date" in df.columns:
+        df["_parsed_date"] = _parse_fusioo_dates(df["date"])
+        df = df[_mask_range(df["_parsed_date"], start_date, end_date)].copy()
+
+    # Calculate views: convert both columns together and reduce them in one pass
+    view_cols = [c for c in ["total_digital_views", "total_newsletter_views"] if c in df.columns]
+    if view_cols:
+        # Keep the numeric columns on df for the trend chart; nansum skips unparseable values
+        df[view_cols] = df[view_cols].apply(pd.to_numeric, errors='coerce')
+        totals = dict(zip(view_cols, np.nansum(df[view_cols].to_numpy(dtype=np.float64), axis=0)))
+        digital_views = totals.get("total_digital_views", 0)
+        newsletter_views = totals.get("total_newsletter_views", 0)
+
+    return df, digital_views, newsletter_views
+
+
 def render_goal2_inspire_engagement(views_data: list, time_unit: str, start_date: date, end_date: date, enrollment_count: int = 0, book_bank_children: int = 0, inperson_events: int = 0, activity_records: list = None, partners_data: list = None, low_income_pct: float = 0.0):
     """Render Goal 2: Inspire Engagement with Content Views."""
     fy_info = get_fiscal_year_info(date.today())
@@ -2920,146 +2438,12 @@ def render_goal2_inspire_engagement(views_data: list, time_unit: str, start_date
     </div>
     """, unsafe_allow_html=True)
 
-    # Calculate recurring partners from activity records (filtered by date range)
-    recurring_partners = []
-    recurring_count = 0
-    partner_names = {}
-    if activity_records and partners_data:
-        # Build partner ID to name mapping
-        for partner in partners_data:
-            pid = partner.get('id', '')
-            site_name = partner.get('site_name', '')
-            if isinstance(site_name, list):
-                site_name = site_name[0] if site_name else ''
-
-            # For "Various" partner, use main_organization_from_list instead
-            if site_name and site_name.lower() == 'various':
-                main_org = partner.get('main_organization_from_list', '')
-                if isinstance(main_org, list):
-                    main_org = main_org[0] if main_org else ''
-                if main_org:
-                    site_name = main_org
-
-            if pid and site_name:
-                partner_names[pid] = site_name
-
-        # Filter activity records by date range and count partner occurrences by NAME
-        partner_name_counts = Counter()
-        for record in activity_records:
-            # Check date range
-            record_date = record.get('date_of_activity') or record.get('date')
-            if record_date:
-                try:
-                    record_dt = pd.to_datetime(record_date)
-                    if not (pd.Timestamp(start_date) <= record_dt <= pd.Timestamp(end_date)):
-                        continue
-                except:
-                    continue
-            else:
-                continue
-
-            # Extract partner name based on record type
-            partner_name = None
-            if record.get('_is_legacy'):
-                # Legacy records: extract name from main_partner, site_name_new, or site_name
-                main_partner = record.get('main_partner', '')
-                if isinstance(main_partner, list):
-                    main_partner = main_partner[0] if main_partner else ''
-
-                if main_partner and '* Other - See Site Name' not in str(main_partner):
-                    partner_name = main_partner
-                else:
-                    # Check site_name_new
-                    site_name_new = record.get('site_name_new', '')
-                    if isinstance(site_name_new, list):
-                        site_name_new = site_name_new[0] if site_name_new else ''
-
-                    if site_name_new and '* See Additional Site Names' not in str(site_name_new):
-                        partner_name = site_name_new
-                    else:
-                        # Fall back to site_name (not array)
-                        site_name_val = record.get('site_name', '')
-                        if isinstance(site_name_val, list):
-                            site_name_val = site_name_val[0] if site_name_val else ''
-                        if site_name_val:
-                            partner_name = site_name_val
-            else:
-                # Current records: look up partner name from partners table using ID
-                partner_id = record.get('partners_testing', '')
-                if isinstance(partner_id, list):
-                    partner_id = partner_id[0] if partner_id else ''
-                if partner_id and partner_id in partner_names:
-                    partner_name = partner_names[partner_id]
-
-            if partner_name:
-                partner_name_counts[partner_name] += 1
-
-        # Get recurring partners (appeared more than once)
-        recurring_partners = [(name, count) for name, count in partner_name_counts.most_common() if count > 1]
-        recurring_count = len(recurring_partners)
-
-    # Calculate partners for in-person events (same date range filter)
-    inperson_event_partners = set()
-    if activity_records:
-        for record in activity_records:
-            # Check date range
-            record_date = record.get('date_of_activity') or record.get('date')
-            if record_date:
-                try:
-                    record_dt = pd.to_datetime(record_date)
-                    if not (pd.Timestamp(start_date) <= record_dt <= pd.Timestamp(end_date)):
-                        continue
-                except:
-                    continue
-            else:
-                continue
-
-            # Check if it's an in-person event
-            activity_type = record.get('activity_type', '')
-            if isinstance(activity_type, list):
-                activity_type = ', '.join(str(x) for x in activity_type)
-            if not ("Literacy Materials Distribution" in str(activity_type) or "Family Literacy Activity" in str(activity_type)):
-                continue
-
-            # Get partner name based on record type
-            partner_name = None
-            if record.get('_is_legacy'):
-                # Legacy records: extract name from main_partner, site_name_new, or site_name
-                main_partner = record.get('main_partner', '')
-                if isinstance(main_partner, list):
-                    main_partner = main_partner[0] if main_partner else ''
-
-                if main_partner and '* Other - See Site Name' not in str(main_partner):
-                    partner_name = main_partner
-                else:
-                    site_name_new = record.get('site_name_new', '')
-                    if isinstance(site_name_new, list):
-                        site_name_new = site_name_new[0] if site_name_new else ''
-
-                    if site_name_new and '* See Additional Site Names' not in str(site_name_new):
-                        partner_name = site_name_new
-                    else:
-                        site_name_val = record.get('site_name', '')
-                        if isinstance(site_name_val, list):
-                            site_name_val = site_name_val[0] if site_name_val else ''
-                        if site_name_val:
-                            partner_name = site_name_val
-            else:
-                # Current records: look up partner name from partners table
-                partner_id = record.get('partners_testing', '')
-                if isinstance(partner_id, list):
-                    partner_id = partner_id[0] if partner_id else ''
-                if partner_id and partner_id in partner_names:
-                    partner_name = partner_names[partner_id]
-
-            if partner_name:
-                inperson_event_partners.add(partner_name)
+    # Recurring partners and in-person event partners (filtered by date range)
+    recurring_partners, inperson_event_partners = compute_partner_metrics(activity_records, partners_data, start_date, end_date)
+    recurring_count = len(recurring_partners)
 
     # Build in-person event partners HTML
-    inperson_partners_html = ""
-    if inperson_event_partners:
-        partner_items = [f"<span style='background: #fce7f3; padding: 0.15rem 0.4rem; border-radius: 4px; font-size: 0.65rem; color: #9d174d; white-space: nowrap;'>{name}</span>" for name in sorted(inperson_event_partners)]
-        inperson_partners_html = " ".join(partner_items)
+    inperson_partners_html = " ".join(map(_INPERSON_PARTNER_TMPL.__mod__, inperson_event_partners))
 
     # In-Person Events box
     st.markdown(f"""
@@ -3080,7 +2464,7 @@ def render_goal2_inspire_engagement(views_data: list, time_unit: str, start_date
     if recurring_partners:
         partner_items = []
         for name, count in recurring_partners:
-            partner_items.append(f"<span style='background: #d1fae5; padding: 0.15rem 0.4rem; border-radius: 4px; font-size: 0.7rem; color: #065f46; white-space: nowrap;'>{name} <strong>({count})</strong></span>")
+            partner_items.append(f"<span class='recurring-pill'>{name} <strong>({count})</strong></span>")
         all_partners_html = " ".join(partner_items)
 
     st.markdown(f"""
@@ -3103,36 +2487,8 @@ def render_goal2_inspire_engagement(views_data: list, time_unit: str, start_date
     target_views = 1_500_000
 
     if views_data:
-        df = pd.DataFrame(views_data)
-
-        # Convert list columns
-        for col in df.columns:
-            if df[col].apply(lambda x: isinstance(x, list)).any():
-                df[col] = df[col].apply(
-                    lambda x: x[0] if isinstance(x, list) and len(x) == 1
-                    else ", ".join(str(i) for i in x) if isinstance(x, list)
-                    else x
-                )
-
-        # Parse and filter by date
-        if "date" in df.columns:
-            df["_parsed_date"] = df["date"].apply(
-                lambda x: x.split("|")[0] if isinstance(x, str) and "|" in x else x
-            )
-            df["_parsed_date"] = pd.to_datetime(df["_parsed_date"], errors='coerce')
-            mask = (df["_parsed_date"] >= pd.Timestamp(start_date)) & (df["_parsed_date"] <= pd.Timestamp(end_date))
-            df = df[mask].copy()
-
-        # Calculate views
-        if "total_digital_views" in df.columns:
-            df["total_digital_views"] = pd.to_numeric(df["total_digital_views"], errors='coerce').fillna(0)
-            digital_views = df["total_digital_views"].sum()
-        if "total_newsletter_views" in df.columns:
-            df["total_newsletter_views"] = pd.to_numeric(df["total_newsletter_views"], errors='coerce').fillna(0)
-            newsletter_views = df["total_newsletter_views"].sum()
-
+        df, digital_views, newsletter_views = compute_views_metrics(views_data, start_date, end_date)
         total_views = digital_views + newsletter_views
-
     # Program Reach Section - All three rings in one row
     st.markdown("##### 🏠 Program Reach & Digital Engagement")
 
@@ -3145,19 +2501,7 @@ def render_goal2_inspire_engagement(views_data: list, time_unit: str, start_date
     digital_pct = (total_views / target_views * 100) if target_views > 0 else 0
 
     def create_count_ring(count, target, pct, color_fill, is_large_number=False):
-        """Create a donut chart showing progress toward target."""
-        display_pct = min(pct, 100)
-        remaining_pct = max(100 - display_pct, 0)
-
-        fig = go.Figure(data=[go.Pie(
-            values=[display_pct, remaining_pct],
-            hole=0.7,
-            marker=dict(colors=[color_fill, '#e2e8f0']),
-            textinfo='none',
-            hoverinfo='skip',
-            sort=False
-        )])
-
+        """Create a donut ring showing progress toward target."""
         # Format count
         if is_large_number and count >= 1000000:
             count_str = f"{count/1000000:.1f}M"
@@ -3174,28 +2518,7 @@ def render_goal2_inspire_engagement(views_data: list, time_unit: str, start_date
         else:
             target_str = f"{target:,}"
 
-        fig.update_layout(
-            showlegend=False,
-            margin=dict(t=30, b=30, l=10, r=10),
-            height=230,
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            annotations=[
-                dict(
-                    text=f"<b>{count_str}</b>",
-                    x=0.5, y=0.55,
-                    font=dict(size=22, color='#1a365d', family='system-ui'),
-                    showarrow=False
-                ),
-                dict(
-                    text=f"{pct:.0f}% of goal",
-                    x=0.5, y=0.38,
-                    font=dict(size=12, color='#64748b', family='system-ui'),
-                    showarrow=False
-                )
-            ]
-        )
-        return fig, target_str
+        return create_ring_svg(count_str, f"{pct:.0f}% of goal", pct, color_fill), target_str
 
     # All three rings with stats: Home Delivery + Low Income | Book Bank | Digital Engagement | Digital Stats
     col1, col1b, col2, col3, col4 = st.columns([1, 0.5, 1, 1, 0.8])
@@ -3203,8 +2526,8 @@ def render_goal2_inspire_engagement(views_data: list, time_unit: str, start_date
     with col1:
         st.markdown("<p style='text-align: center; font-weight: 600; color: #1a365d; font-size: 0.85rem; margin-bottom: -10px;'>B3 In-Home Delivery</p>", unsafe_allow_html=True)
         st.markdown("<p style='text-align: center; color: #64748b; font-size: 0.7rem; margin-bottom: -10px;'>Active Enrollments</p>", unsafe_allow_html=True)
-        fig, target_str = create_count_ring(enrollment_count, home_target, home_pct, '#3182ce')
-        st.plotly_chart(fig, use_container_width=True, key="home_delivery_ring")
+        ring_html, target_str = create_count_ring(enrollment_count, home_target, home_pct, '#3182ce')
+        st.markdown(ring_html, unsafe_allow_html=True)
         st.markdown(f"<p style='text-align: center; margin-top: -20px; color: #1a365d; font-size: 0.85rem; font-weight: 700;'>2030 Target: {target_str} families</p>", unsafe_allow_html=True)
 
     with col1b:
@@ -3221,15 +2544,15 @@ def render_goal2_inspire_engagement(views_data: list, time_unit: str, start_date
     with col2:
         st.markdown("<p style='text-align: center; font-weight: 600; color: #1a365d; font-size: 0.85rem; margin-bottom: -10px;'>Book Bank Model</p>", unsafe_allow_html=True)
         st.markdown("<p style='text-align: center; color: #64748b; font-size: 0.7rem; margin-bottom: -10px;'>Open Book Distribution</p>", unsafe_allow_html=True)
-        fig, target_str = create_count_ring(book_bank_children, book_bank_target, book_bank_pct, '#805ad5')
-        st.plotly_chart(fig, use_container_width=True, key="book_bank_ring")
+        ring_html, target_str = create_count_ring(book_bank_children, book_bank_target, book_bank_pct, '#805ad5')
+        st.markdown(ring_html, unsafe_allow_html=True)
         st.markdown(f"<p style='text-align: center; margin-top: -20px; color: #1a365d; font-size: 0.85rem; font-weight: 700;'>2030 Target: {target_str} children</p>", unsafe_allow_html=True)
 
     with col3:
         st.markdown("<p style='text-align: center; font-weight: 600; color: #1a365d; font-size: 0.85rem; margin-bottom: -10px;'>Digital Engagement</p>", unsafe_allow_html=True)
         st.markdown("<p style='text-align: center; color: #64748b; font-size: 0.7rem; margin-bottom: -10px;'>Total Views</p>", unsafe_allow_html=True)
-        fig, target_str = create_count_ring(int(total_views), target_views, digital_pct, '#ed8936', is_large_number=True)
-        st.plotly_chart(fig, use_container_width=True, key="digital_engagement_ring")
+        ring_html, target_str = create_count_ring(int(total_views), target_views, digital_pct, '#ed8936', is_large_number=True)
+        st.markdown(ring_html, unsafe_allow_html=True)
         st.markdown(f"<p style='text-align: center; margin-top: -20px; color: #1a365d; font-size: 0.85rem; font-weight: 700;'>2030 Target: {target_str} views/year</p>", unsafe_allow_html=True)
 
     with col4:
@@ -3266,22 +2589,20 @@ def render_goal2_inspire_engagement(views_data: list, time_unit: str, start_date
                 freq_map = {"day": "D", "week": "W", "month": "ME", "quarter": "QE", "year": "YE"}
                 freq = freq_map.get(time_unit, "ME")
 
-                valid_df = df[df["_parsed_date"].notna()]
+                valid_df = df.dropna(subset=["_parsed_date"]).set_index("_parsed_date").sort_index()
                 if not valid_df.empty:
-                    trend_df = valid_df.groupby(pd.Grouper(key="_parsed_date", freq=freq))[view_cols].sum().reset_index()
+                    trend_df = valid_df[view_cols].resample(freq).sum().reset_index()
                     trend_df = trend_df.rename(columns={
                         "_parsed_date": "Period",
                         "total_digital_views": "Digital",
                         "total_newsletter_views": "Newsletter"
                     })
 
-                    # Consistent colors: Digital=blue, Newsletter=green
-                    view_colors = {"Digital": "#3b82f6", "Newsletter": "#10b981"}
                     fig = px.area(
                         trend_df,
                         x="Period",
                         y=[c for c in ["Digital", "Newsletter"] if c in trend_df.columns],
-                        color_discrete_map=view_colors
+                        color_discrete_map=VIEW_COLOR_MAP
                     )
                     fig = style_plotly_chart(fig, height=280)
                     fig.update_traces(stackgroup='one')
@@ -3299,14 +2620,14 @@ def render_goal2_inspire_engagement(views_data: list, time_unit: str, start_date
                 "Type": ["Digital Views", "Newsletter Views"],
                 "Count": [digital_views, newsletter_views]
             })
-            # Consistent colors: Digital=blue, Newsletter=green (matching area chart)
+            # Same colors as the area chart
             fig = px.pie(
                 pie_data,
                 values="Count",
                 names="Type",
                 hole=0.5,
                 color="Type",
-                color_discrete_map={"Digital Views": "#3b82f6", "Newsletter Views": "#10b981"}
+                color_discrete_map=VIEW_COLOR_MAP
             )
             fig = style_plotly_chart(fig, height=280)
             fig.update_traces(
@@ -3339,13 +2660,11 @@ def render_goal3_advance_innovation(books_data: list):
     df = pd.DataFrame(books_data)
 
     # Convert list columns
-    for col in df.columns:
-        if df[col].apply(lambda x: isinstance(x, list)).any():
-            df[col] = df[col].apply(
-                lambda x: x[0] if isinstance(x, list) and len(x) == 1
-                else ", ".join(str(i) for i in x) if isinstance(x, list)
-                else x
-            )
+    for col in df.select_dtypes(include='object').columns:
+        sample = df[col].dropna().head(1)
+        if sample.empty or not isinstance(sample.iloc[0], list):
+            continue
+        df[col] = _flatten_listcol(df[col])
 
     # Metrics
     total = len(df)
@@ -3414,14 +2733,12 @@ def render_goal3_advance_innovation(books_data: list):
             age_counts = df["sub_type"].value_counts().reset_index()
             age_counts.columns = ["Age Group", "Count"]
 
-            # Clean, distinct, readable colors
-            pie_colors = ["#3b82f6", "#10b981", "#f59e0b", "#8b5cf6", "#ec4899", "#06b6d4", "#84cc16"]
             fig = px.pie(
                 age_counts,
                 names="Age Group",
                 values="Count",
                 hole=0.4,
-                color_discrete_sequence=pie_colors
+                color_discrete_sequence=_CATEGORY_COLORS
             )
             fig = style_plotly_chart(fig, height=300)
             fig.update_traces(
@@ -3478,18 +2795,11 @@ def render_goal4_sustainability(processor: DataProcessor, financial_df: pd.DataF
 
             # Helper function to calculate % change
             def pct_change(current, prior):
-                if prior == 0:
-                    return 100.0 if current > 0 else 0.0
-                return ((current - prior) / prior) * 100
+                return float(_pct_change(current, prior))
 
             # Helper function to format currency
             def fmt_currency(val):
-                if val >= 1000000:
-                    return f"${val/1000000:.2f}M"
-                elif val >= 1000:
-                    return f"${val/1000:.1f}K"
-                else:
-                    return f"${val:,.0f}"
+                return format_money(val, k_decimals=1)
 
             # Create tabs for Individuals, Organizations, and Total
             tab1, tab2, tab3 = st.tabs(["👤 Individuals", "🏢 Organizations", "📊 Total"])
@@ -3580,59 +2890,6 @@ def render_goal4_sustainability(processor: DataProcessor, financial_df: pd.DataF
         grants_pct = (grants_received / grants_goal * 100) if grants_goal > 0 else 0
         gifts_pct = (gifts_received / gifts_goal * 100) if gifts_goal > 0 else 0
 
-        def create_progress_ring(received, goal, pct, title, color_fill, color_remaining):
-            """Create a donut chart showing progress toward goal."""
-            # Cap display percentage at 100 for the ring, but show actual in text
-            display_pct = min(pct, 100)
-            remaining_pct = max(100 - display_pct, 0)
-
-            fig = go.Figure(data=[go.Pie(
-                values=[display_pct, remaining_pct],
-                hole=0.7,
-                marker=dict(colors=[color_fill, color_remaining]),
-                textinfo='none',
-                hoverinfo='skip',
-                sort=False
-            )])
-
-            # Format dollar amounts
-            if received >= 1000000:
-                received_str = f"${received/1000000:.2f}M"
-            elif received >= 1000:
-                received_str = f"${received/1000:.0f}K"
-            else:
-                received_str = f"${received:,.0f}"
-
-            if goal >= 1000000:
-                goal_str = f"${goal/1000000:.1f}M"
-            elif goal >= 1000:
-                goal_str = f"${goal/1000:.0f}K"
-            else:
-                goal_str = f"${goal:,.0f}"
-
-            fig.update_layout(
-                showlegend=False,
-                margin=dict(t=30, b=30, l=10, r=10),
-                height=200,
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                annotations=[
-                    dict(
-                        text=f"<b>{received_str}</b>",
-                        x=0.5, y=0.55,
-                        font=dict(size=22, color='#1a365d', family='system-ui'),
-                        showarrow=False
-                    ),
-                    dict(
-                        text=f"{pct:.0f}% of goal",
-                        x=0.5, y=0.38,
-                        font=dict(size=12, color='#64748b', family='system-ui'),
-                        showarrow=False
-                    )
-                ]
-            )
-            return fig, goal_str
-
         # Get donor metrics for gifts stats (current and prior for % change)
         try:
             donor_metrics = get_donor_comparison_metrics()
@@ -3648,51 +2905,39 @@ def render_goal4_sustainability(processor: DataProcessor, financial_df: pd.DataF
             total_revenue_prior = prior.get('total_revenue', 0)
             avg_gift = total_revenue / gift_count if gift_count > 0 else 0
             avg_gift_prior = total_revenue_prior / gift_count_prior if gift_count_prior > 0 else 0
-            has_donor_data = True
-        except Exception:
-            gift_count = new_donors = reactivated = avg_gift = 0
-            gift_count_prior = new_donors_prior = reactivated_prior = avg_gift_prior = 0
-            has_donor_data = False
-
-        # Get grants count from DonorPerfect (using grant GL codes)
-        try:
-            fy_info = get_fiscal_year_info(today)
-            curr_start = fy_info['current_fy_start']
-            curr_end = today.isoformat()
-
-            # Query grants count for current period
-            grant_query = f"SELECT COUNT(*) as grant_count FROM dpgift WHERE gift_date BETWEEN '{curr_start}' AND '{curr_end}' AND gl_code IN ('5120_GRANTS_RES', '5121_GRANTS_UNRES')"
-            grant_results, _ = _execute_donorperfect_query(grant_query)
-            grant_data = grant_results[0] if grant_results else {}
-
-            grant_count = int(grant_data.get('grant_count', 0) or 0)
+            # Grants count from DonorPerfect (grant GL codes), fetched with the donor totals
+            grant_count = curr.get('grant_count', 0)
             # Use grants_received from Google Sheet divided by count from DonorPerfect
             avg_grant = grants_received / grant_count if grant_count > 0 else 0
-            has_grant_data = True
+            has_donor_data = has_grant_data = True
         except Exception:
+            gift_count = new_donors = reactivated = avg_gift = 0
+            gift_count_prior = new_donors_prior = reactivated_prior = avg_gift_prior = 0
             grant_count = avg_grant = 0
-            has_grant_data = False
+            has_donor_data = has_grant_data = False
 
         def pct_change(curr_val, prior_val):
-            if prior_val == 0:
-                return 100.0 if curr_val > 0 else 0.0
-            return ((curr_val - prior_val) / prior_val) * 100
+            return float(_pct_change(curr_val, prior_val))
 
         # All three rings and stats in one row: Grants | Grant Stats | Gifts | Gift Stats | Books
         col1, col2, col3, col4, col5 = st.columns([1, 0.8, 1, 1.2, 1])
 
         with col1:
-            st.markdown("<p style='text-align: center; font-weight: 600; color: #1a365d; font-size: 0.9rem; margin-bottom: -10px;'>Grants</p>", unsafe_allow_html=True)
-            fig, goal_str = create_progress_ring(
+            # Title, ring and goal line go out as a single markdown element
+            ring_html, goal_str = create_progress_ring(
                 grants_received, grants_goal, grants_pct,
                 "Grants", "#38a169", "#e2e8f0"
             )
-            st.plotly_chart(fig, use_container_width=True, key="grants_ring")
-            st.markdown(f"<p style='text-align: center; margin-top: -20px; color: #1a365d; font-size: 0.85rem; font-weight: 700;'>Goal: {goal_str}</p>", unsafe_allow_html=True)
+            st.markdown(
+                "<p style='text-align: center; font-weight: 600; color: #1a365d; font-size: 0.9rem; margin-bottom: -10px;'>Grants</p>"
+                f"{ring_html}"
+                f"<p style='text-align: center; margin-top: -20px; color: #1a365d; font-size: 0.85rem; font-weight: 700;'>Goal: {goal_str}</p>",
+                unsafe_allow_html=True
+            )
 
         with col2:
             if has_grant_data:
-                avg_grant_str = f"${avg_grant/1000:.1f}K" if avg_grant >= 1000 else f"${avg_grant:,.0f}"
+                avg_grant_str = format_money(avg_grant, k_decimals=1)
                 st.markdown(f"""
                     <div style='display: grid; grid-template-columns: 1fr; gap: 0.4rem; padding-top: 1.5rem;'>
                         <div class="metric-card" style="text-align: center; padding: 0.5rem;">
@@ -3707,91 +2952,53 @@ def render_goal4_sustainability(processor: DataProcessor, financial_df: pd.DataF
                 """, unsafe_allow_html=True)
 
         with col3:
-            st.markdown("<p style='text-align: center; font-weight: 600; color: #1a365d; font-size: 0.9rem; margin-bottom: -10px;'>Gifts</p>", unsafe_allow_html=True)
-            fig, goal_str = create_progress_ring(
+            ring_html, goal_str = create_progress_ring(
                 gifts_received, gifts_goal, gifts_pct,
                 "Gifts", "#805ad5", "#e2e8f0"
             )
-            st.plotly_chart(fig, use_container_width=True, key="gifts_ring")
-            st.markdown(f"<p style='text-align: center; margin-top: -20px; color: #1a365d; font-size: 0.85rem; font-weight: 700;'>Goal: {goal_str}</p>", unsafe_allow_html=True)
+            st.markdown(
+                "<p style='text-align: center; font-weight: 600; color: #1a365d; font-size: 0.9rem; margin-bottom: -10px;'>Gifts</p>"
+                f"{ring_html}"
+                f"<p style='text-align: center; margin-top: -20px; color: #1a365d; font-size: 0.85rem; font-weight: 700;'>Goal: {goal_str}</p>",
+                unsafe_allow_html=True
+            )
 
         with col4:
             if has_donor_data:
-                avg_gift_str = f"${avg_gift/1000:.1f}K" if avg_gift >= 1000 else f"${avg_gift:,.0f}"
-                gift_chg = pct_change(gift_count, gift_count_prior)
-                new_chg = pct_change(new_donors, new_donors_prior)
-                ret_chg = pct_change(reactivated, reactivated_prior)
-                avg_chg = pct_change(avg_gift, avg_gift_prior)
+                avg_gift_str = format_money(avg_gift, k_decimals=1)
+                gift_stats = (
+                    ("🎁 Gifts", f"{gift_count:,}", pct_change(gift_count, gift_count_prior)),
+                    ("🆕 New", f"{new_donors:,}", pct_change(new_donors, new_donors_prior)),
+                    ("🔄 Returning", f"{reactivated:,}", pct_change(reactivated, reactivated_prior)),
+                    ("📊 Avg Gift", avg_gift_str, pct_change(avg_gift, avg_gift_prior)),
+                )
+                cards_html = "".join(
+                    GIFT_STAT_CARD_HTML.format_map({
+                        'label': label,
+                        'value': value,
+                        'chg': chg,
+                        'color': '#38a169' if chg >= 0 else '#e53e3e',
+                        'sign': '+' if chg >= 0 else '',
+                        'prior_fy_label': prior_fy_label,
+                    })
+                    for label, value, chg in gift_stats
+                )
                 st.markdown(f"""
-                    <div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.4rem; padding-top: 0.5rem;'>
-                        <div class="metric-card" style="text-align: center; padding: 0.5rem;">
-                            <div style="font-size: 0.65rem; color: #718096; margin-bottom: 0.15rem;">🎁 Gifts</div>
-                            <div style="font-size: 1rem; font-weight: 700; color: #1a365d;">{gift_count:,}</div>
-                            <div style="font-size: 0.6rem; color: {'#38a169' if gift_chg >= 0 else '#e53e3e'};">
-                                {'+' if gift_chg >= 0 else ''}{gift_chg:.0f}% vs {prior_fy_label}
-                            </div>
-                        </div>
-                        <div class="metric-card" style="text-align: center; padding: 0.5rem;">
-                            <div style="font-size: 0.65rem; color: #718096; margin-bottom: 0.15rem;">🆕 New</div>
-                            <div style="font-size: 1rem; font-weight: 700; color: #1a365d;">{new_donors:,}</div>
-                            <div style="font-size: 0.6rem; color: {'#38a169' if new_chg >= 0 else '#e53e3e'};">
-                                {'+' if new_chg >= 0 else ''}{new_chg:.0f}% vs {prior_fy_label}
-                            </div>
-                        </div>
-                        <div class="metric-card" style="text-align: center; padding: 0.5rem;">
-                            <div style="font-size: 0.65rem; color: #718096; margin-bottom: 0.15rem;">🔄 Returning</div>
-                            <div style="font-size: 1rem; font-weight: 700; color: #1a365d;">{reactivated:,}</div>
-                            <div style="font-size: 0.6rem; color: {'#38a169' if ret_chg >= 0 else '#e53e3e'};">
-                                {'+' if ret_chg >= 0 else ''}{ret_chg:.0f}% vs {prior_fy_label}
-                            </div>
-                        </div>
-                        <div class="metric-card" style="text-align: center; padding: 0.5rem;">
-                            <div style="font-size: 0.65rem; color: #718096; margin-bottom: 0.15rem;">📊 Avg Gift</div>
-                            <div style="font-size: 1rem; font-weight: 700; color: #1a365d;">{avg_gift_str}</div>
-                            <div style="font-size: 0.6rem; color: {'#38a169' if avg_chg >= 0 else '#e53e3e'};">
-                                {'+' if avg_chg >= 0 else ''}{avg_chg:.0f}% vs {prior_fy_label}
-                            </div>
-                        </div>
+                    <div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.4rem; padding-top: 0.5rem;'>{cards_html}
                     </div>
                 """, unsafe_allow_html=True)
 
         with col5:
-            st.markdown("<p style='text-align: center; font-weight: 600; color: #1a365d; font-size: 0.9rem; margin-bottom: -10px;'>Donated Books</p>", unsafe_allow_html=True)
-            # Create progress ring for donated books (use a different format since it's count not currency)
-            display_pct = min(donated_books_pct, 100)
-            remaining_pct = max(100 - display_pct, 0)
-            fig = go.Figure(data=[go.Pie(
-                values=[display_pct, remaining_pct],
-                hole=0.7,
-                marker=dict(colors=['#e53e3e', '#e2e8f0']),
-                textinfo='none',
-                hoverinfo='skip',
-                sort=False
-            )])
-            fig.update_layout(
-                showlegend=False,
-                margin=dict(t=30, b=30, l=10, r=10),
-                height=200,
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                annotations=[
-                    dict(
-                        text=f"<b>{donated_books_count:,}</b>",
-                        x=0.5, y=0.55,
-                        font=dict(size=22, color='#1a365d', family='system-ui'),
-                        showarrow=False
-                    ),
-                    dict(
-                        text=f"{donated_books_pct:.0f}% of goal",
-                        x=0.5, y=0.38,
-                        font=dict(size=12, color='#64748b', family='system-ui'),
-                        showarrow=False
-                    )
-                ]
+            ring_html, goal_str = create_progress_ring(
+                donated_books_count, donated_books_goal, donated_books_pct,
+                "Donated Books", "#e53e3e", "#e2e8f0", value_format="count"
+            )
+            st.markdown(
+                "<p style='text-align: center; font-weight: 600; color: #1a365d; font-size: 0.9rem; margin-bottom: -10px;'>Donated Books</p>"
+                f"{ring_html}"
+                f"<p style='text-align: center; margin-top: -20px; color: #1a365d; font-size: 0.85rem; font-weight: 700;'>Goal: {goal_str} books</p>",
+                unsafe_allow_html=True
             )
-            st.plotly_chart(fig, use_container_width=True, key="donated_books_ring")
-            goal_str = f"{donated_books_goal:,.0f}" if donated_books_goal < 1000 else f"{donated_books_goal/1000:.0f}K"
-            st.markdown(f"<p style='text-align: center; margin-top: -20px; color: #1a365d; font-size: 0.85rem; font-weight: 700;'>Goal: {goal_str} books</p>", unsafe_allow_html=True)
 
     else:
         st.info("Financial data not available")
@@ -3811,78 +3018,32 @@ def render_goal4_sustainability(processor: DataProcessor, financial_df: pd.DataF
         current_col = f"{current_fy} YTD"
         prior_col = f"{prior_fy} YTD"
 
-        # Type labels for display (from DonorPerfect activity codes)
-        type_labels = {
-            'ANNUALREPORT': 'Annual Report',
-            'APPLICATION': 'Application',
-            'APPDUE': 'Application Due Date',
-            'BIRTHDAYCARD': 'Birthday Card',
-            'CAPITALCAMPAIGNCULTIVATION': 'Capital Campaign Cultivation',
-            'CC': 'Constant Contact Campaign',
-            'CONTRACT': 'Contract',
-            'EI': 'Email In',
-            'EO': 'Email Out',
-            'EVENT': 'Event',
-            'EV_IN': 'Event Invite',
-            'FBS': 'FBS Appeal',
-            'FIREP': 'Final Report',
-            'FOLLOWUP': 'Follow Up with Donor',
-            'GENERALINFO': 'General Info',
-            'GE': 'Group E-Mail',
-            'GFU': 'Grant Follow-Up',
-            'GLOI': 'Grant LOI',
-            'GP': 'Grant Proposal',
-            'GR': 'Grant Report Due',
-            'GRANTAWARD': 'Grant Award',
-            'GRANTDECLINED': 'Grant Declined',
-            'LT': 'Letter',
-            'LUNCHEONINVITE': 'Luncheon Invitation',
-            'MA': 'Mailing',
-            'MAJORGIFTSCULTIVATION': 'Major Gifts Cultivation',
-            'ME': 'Meeting',
-            'PLEDGE': 'Pledge Follow Up',
-            'PROSPECTRESEARCH': 'Prospect Research',
-            'RCPTSNT': 'Receipt Sent',
-            'SP': 'Sponsorship Proposal',
-            'SPONSORSHIPAGREEMENT': 'Sponsorship Agreement',
-            'TE': 'Telephone Call',
-            'TYNOTE': 'Thank You Note',
-            'VI': 'Visit',
-            'YEA_MAIL': 'Year End Appeal Mailer',
-            'ZOOMCALL': 'Zoom Call',
-            'DONORACTIVITY': 'Donor Activity',
-            'GRANTACTIVITY': 'Grant Activity',
-        }
+        # Nothing to compare (e.g. DonorPerfect returned no activity) - skip the tables and charts
+        if not (current_metrics['by_type'] or prior_metrics['by_type']):
+            st.info("No contact activity in this period.")
+            return
 
         # Get all unique contact types from both periods
         all_types = set(current_metrics['by_type'].keys()) | set(prior_metrics['by_type'].keys())
         # Sort: known types first in preferred order, then unknown types alphabetically
-        preferred_order = [
-            'DONORACTIVITY', 'GRANTACTIVITY',
-            'CC', 'EO', 'EI', 'GE', 'MA', 'LT', 'RCPTSNT', 'TYNOTE',
-            'TE', 'ME', 'ZOOMCALL', 'VI', 'EVENT', 'EV_IN', 'LUNCHEONINVITE',
-            'GFU', 'GP', 'GLOI', 'GRANTAWARD', 'GRANTDECLINED', 'GR', 'FIREP',
-            'APPLICATION', 'APPDUE', 'CONTRACT', 'PLEDGE', 'FOLLOWUP',
-            'FBS', 'YEA_MAIL', 'BIRTHDAYCARD', 'ANNUALREPORT',
-            'SP', 'SPONSORSHIPAGREEMENT', 'CAPITALCAMPAIGNCULTIVATION', 'MAJORGIFTSCULTIVATION',
-            'PROSPECTRESEARCH', 'GENERALINFO'
-        ]
-        contact_types = [t for t in preferred_order if t in all_types]
-        contact_types += sorted([t for t in all_types if t not in preferred_order])
-
-        comparison_data = []
-        for ct in contact_types:
-            current_count = current_metrics['by_type'].get(ct, 0)
-            prior_count = prior_metrics['by_type'].get(ct, 0)
-            change = current_count - prior_count
-            pct_change = ((current_count - prior_count) / prior_count * 100) if prior_count > 0 else (100 if current_count > 0 else 0)
-            comparison_data.append({
-                'Contact Type': type_labels.get(ct, ct),
-                current_col: current_count,
-                prior_col: prior_count,
-                'Change': change,
-                '% Change': pct_change
-            })
+        unknown_rank = len(CONTACT_TYPE_ORDER)
+        contact_types = sorted(all_types, key=lambda t: (CONTACT_TYPE_ORDER_INDEX.get(t, unknown_rank), t))
+
+        # Align both periods by contact type and compute changes column-wise
+        counts = pd.concat(
+            [pd.Series(current_metrics['by_type'], dtype='int64'), pd.Series(prior_metrics['by_type'], dtype='int64')],
+            axis=1, keys=[current_col, prior_col]
+        ).reindex(contact_types).fillna(0).astype('int64')
+        current_counts = counts[current_col].to_numpy()
+        prior_counts = counts[prior_col].to_numpy()
+        change = current_counts - prior_counts
+        comparison_df = pd.DataFrame({
+            'Contact Type': [CONTACT_TYPE_LABELS.get(ct, ct) for ct in contact_types],
+            current_col: current_counts,
+            prior_col: prior_counts,
+            'Change': change,
+            '% Change': _pct_change(current_counts, prior_counts)
+        })
 
         # Calculate totals
         total_current = current_metrics['total']
@@ -3904,36 +3065,20 @@ def render_goal4_sustainability(processor: DataProcessor, financial_df: pd.DataF
         grant_pct = ((grant_current - grant_prior) / grant_prior * 100) if grant_prior > 0 else 0
 
         # Create metric cards row for contact totals
+        cards_html = "".join(
+            CONTACT_METRIC_CARD_HTML.format(
+                label=label, value=value, pct=pct, prior_fy=prior_fy,
+                color='#38a169' if pct >= 0 else '#e53e3e', sign='+' if pct >= 0 else ''
+            )
+            for label, value, pct in (
+                (f"📬 Total Contacts {current_fy}", total_current, total_pct),
+                ("📧 Constant Contact", cc_current, cc_pct),
+                ("🤝 Donor Activity", donor_current, donor_pct),
+                ("📋 Grant Activity", grant_current, grant_pct),
+            )
+        )
         st.markdown(f"""
-        <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem; margin-bottom: 1.5rem;">
-            <div class="metric-card" style="text-align: center; padding: 1.25rem;">
-                <div style="font-size: 0.85rem; color: #718096; margin-bottom: 0.5rem;">📬 Total Contacts {current_fy}</div>
-                <div style="font-size: 1.75rem; font-weight: 700; color: #1a365d;">{total_current:,}</div>
-                <div style="font-size: 0.8rem; color: {'#38a169' if total_change >= 0 else '#e53e3e'}; margin-top: 0.25rem;">
-                    {'+' if total_pct >= 0 else ''}{total_pct:.1f}% vs {prior_fy}
-                </div>
-            </div>
-            <div class="metric-card" style="text-align: center; padding: 1.25rem;">
-                <div style="font-size: 0.85rem; color: #718096; margin-bottom: 0.5rem;">📧 Constant Contact</div>
-                <div style="font-size: 1.75rem; font-weight: 700; color: #1a365d;">{cc_current:,}</div>
-                <div style="font-size: 0.8rem; color: {'#38a169' if cc_pct >= 0 else '#e53e3e'}; margin-top: 0.25rem;">
-                    {'+' if cc_pct >= 0 else ''}{cc_pct:.1f}% vs {prior_fy}
-                </div>
-            </div>
-            <div class="metric-card" style="text-align: center; padding: 1.25rem;">
-                <div style="font-size: 0.85rem; color: #718096; margin-bottom: 0.5rem;">🤝 Donor Activity</div>
-                <div style="font-size: 1.75rem; font-weight: 700; color: #1a365d;">{donor_current:,}</div>
-                <div style="font-size: 0.8rem; color: {'#38a169' if donor_pct >= 0 else '#e53e3e'}; margin-top: 0.25rem;">
-                    {'+' if donor_pct >= 0 else ''}{donor_pct:.1f}% vs {prior_fy}
-                </div>
-            </div>
-            <div class="metric-card" style="text-align: center; padding: 1.25rem;">
-                <div style="font-size: 0.85rem; color: #718096; margin-bottom: 0.5rem;">📋 Grant Activity</div>
-                <div style="font-size: 1.75rem; font-weight: 700; color: #1a365d;">{grant_current:,}</div>
-                <div style="font-size: 0.8rem; color: {'#38a169' if grant_pct >= 0 else '#e53e3e'}; margin-top: 0.25rem;">
-                    {'+' if grant_pct >= 0 else ''}{grant_pct:.1f}% vs {prior_fy}
-                </div>
-            </div>
+        <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem; margin-bottom: 1.5rem;">{cards_html}
         </div>
         """, unsafe_allow_html=True)
 
@@ -3942,172 +3087,141 @@ def render_goal4_sustainability(processor: DataProcessor, financial_df: pd.DataF
 
         with col1:
             # Create horizontal grouped bar chart for YoY comparison (matches CC Status chart)
-            comparison_df = pd.DataFrame(comparison_data)
-            chart_df = comparison_df.copy()
-
-            contact_types = chart_df['Contact Type'].tolist()
-            current_vals = chart_df[current_col].tolist()
-            prior_vals = chart_df[prior_col].tolist()
-            pct_changes = chart_df['% Change'].tolist()
+            # Plotly takes the NumPy columns directly, no list conversion needed
+            contact_types = comparison_df['Contact Type'].to_numpy()
+            current_vals = comparison_df[current_col].to_numpy()
+            prior_vals = comparison_df[prior_col].to_numpy()
+            pct_changes = comparison_df['% Change'].to_numpy()
 
             # Get max value for x-axis range
-            max_val = max(max(current_vals), max(prior_vals))
-
-            fig = go.Figure()
-
-            # Prior FY bars (lighter color)
-            fig.add_trace(go.Bar(
-                name=prior_col,
-                y=contact_types,
-                x=prior_vals,
-                orientation='h',
-                marker_color='#a0aec0',
-                text=[f'{v:,.0f}' for v in prior_vals],
-                textposition='outside',
-                textfont=dict(size=9, color='#718096'),
-                width=0.35,
-                offset=-0.18
-            ))
-
-            # Current FY bars (primary color)
-            fig.add_trace(go.Bar(
-                name=current_col,
-                y=contact_types,
-                x=current_vals,
-                orientation='h',
-                marker_color='#667eea',
-                text=[f'{v:,.0f}' for v in current_vals],
-                textposition='outside',
-                textfont=dict(size=10),
-                width=0.35,
-                offset=0.18
-            ))
-
-            fig = style_plotly_chart(fig, height=320)
-            fig.update_layout(
-                barmode='group',
-                bargap=0.25,
-                title=dict(text='Contact Volume by Type', font=dict(size=14)),
-                xaxis=dict(range=[0, max_val * 1.5]),  # Headroom for labels with % change
-                yaxis=dict(autorange='reversed'),  # Largest at top
-                legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1, font=dict(size=10))
-            )
-
-            # Add % change annotations positioned relative to current FY bar text
-            for i, (val, pct) in enumerate(zip(current_vals, pct_changes)):
-                color = '#38a169' if pct > 0 else '#e53e3e'
-                sign = '+' if pct > 0 else ''
-                # Position at end of bar value text, aligned with current FY bar
-                fig.add_annotation(
-                    x=val,
-                    y=contact_types[i],
-                    text=f'  <b>({sign}{pct:.0f}%)</b>',
-                    showarrow=False,
-                    font=dict(size=10, color=color),
-                    xanchor='left',
-                    yanchor='middle',
-                    xshift=30,  # Shift right past the number text
-                    yshift=-18  # Align with current FY bar
-                )
+            max_val = float(np.concatenate([current_vals, prior_vals]).max())
 
-            st.plotly_chart(fig, use_container_width=True)
-
-        with col2:
-            # CC Campaign Status - Horizontal Bar Chart with YoY comparison
-            if current_metrics['cc_by_status'] or prior_metrics.get('cc_by_status'):
-                # Get all unique statuses from both periods
-                all_statuses = set(current_metrics.get('cc_by_status', {}).keys()) | set(prior_metrics.get('cc_by_status', {}).keys())
-
-                # Build comparison data sorted by current FY value descending
-                cc_compare = []
-                for status in all_statuses:
-                    curr_val = current_metrics.get('cc_by_status', {}).get(status, 0)
-                    prior_val = prior_metrics.get('cc_by_status', {}).get(status, 0)
-                    pct_chg = ((curr_val - prior_val) / prior_val * 100) if prior_val > 0 else (100 if curr_val > 0 else 0)
-                    cc_compare.append({
-                        'status': status,
-                        'current': curr_val,
-                        'prior': prior_val,
-                        'pct_change': pct_chg
-                    })
-                cc_compare.sort(key=lambda x: x['current'], reverse=True)
-
-                statuses = [d['status'] for d in cc_compare]
-                current_vals = [d['current'] for d in cc_compare]
-                prior_vals = [d['prior'] for d in cc_compare]
-                pct_changes = [d['pct_change'] for d in cc_compare]
-
-                # Create text labels with % change
-                current_texts = []
-                for val, pct in zip(current_vals, pct_changes):
-                    if pct >= 0:
-                        current_texts.append(f'{val:,.0f} <span style="color:#38a169">(+{pct:.0f}%)</span>')
-                    else:
-                        current_texts.append(f'{val:,.0f} <span style="color:#e53e3e">({pct:.0f}%)</span>')
-
-                fig_cc = go.Figure()
-
-                # Prior FY bars (lighter color, behind)
-                fig_cc.add_trace(go.Bar(
-                    name=prior_fy,
-                    y=statuses,
+            fig = go.Figure(data=[
+                # Prior FY bars (lighter color)
+                go.Bar(
+                    name=prior_col,
+                    y=contact_types,
                     x=prior_vals,
                     orientation='h',
                     marker_color='#a0aec0',
-                    text=[f'{v:,.0f}' for v in prior_vals],
+                    texttemplate='%{x:,.0f}',  # Formatted by Plotly client-side
                     textposition='outside',
                     textfont=dict(size=9, color='#718096'),
                     width=0.35,
                     offset=-0.18
-                ))
-
-                # Current FY bars (primary color, in front)
-                fig_cc.add_trace(go.Bar(
-                    name=current_fy,
-                    y=statuses,
+                ),
+                # Current FY bars (primary color)
+                go.Bar(
+                    name=current_col,
+                    y=contact_types,
                     x=current_vals,
                     orientation='h',
                     marker_color='#667eea',
-                    text=[f'{v:,.0f}' for v in current_vals],
+                    texttemplate='%{x:,.0f}',
                     textposition='outside',
                     textfont=dict(size=10),
                     width=0.35,
                     offset=0.18
-                ))
+                )
+            ], layout=plotly_chart_layout(
+                height=320,
+                barmode='group',
+                bargap=0.25,
+                title=dict(text='Contact Volume by Type', font=dict(size=14)),
+                xaxis=dict(range=[0, max_val * 1.5]),  # Headroom for labels with % change
+                yaxis=dict(autorange='reversed'),  # Largest at top
+                legend=dict(font=dict(size=10)),
+                # % change annotations positioned relative to current FY bar text
+                annotations=_pct_change_annotations(contact_types, current_vals, pct_changes)
+            ))
 
-                max_val = max(max(current_vals) if current_vals else 0, max(prior_vals) if prior_vals else 0)
-                fig_cc = style_plotly_chart(fig_cc, height=340)
-                fig_cc.update_layout(
+            st.plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            # CC Campaign Status - Horizontal Bar Chart with YoY comparison
+            if current_metrics.get('cc_by_status') or prior_metrics.get('cc_by_status'):
+                # Align statuses from both periods, sorted by current FY value descending
+                cc_df = pd.DataFrame({
+                    'current': pd.Series(current_metrics.get('cc_by_status', {}), dtype='int64'),
+                    'prior': pd.Series(prior_metrics.get('cc_by_status', {}), dtype='int64'),
+                }).fillna(0).astype('int64')
+                cc_df['pct_change'] = _pct_change(cc_df['current'].to_numpy(), cc_df['prior'].to_numpy())
+                cc_df = cc_df.sort_values('current', ascending=False, kind='stable')
+
+                statuses = cc_df.index.to_numpy()
+                current_vals = cc_df['current'].to_numpy()
+                prior_vals = cc_df['prior'].to_numpy()
+                pct_changes = cc_df['pct_change'].to_numpy()
+
+                max_val = float(np.concatenate([current_vals, prior_vals]).max())
+                fig_cc = go.Figure(data=[
+                    # Prior FY bars (lighter color, behind)
+                    go.Bar(
+                        name=prior_fy,
+                        y=statuses,
+                        x=prior_vals,
+                        orientation='h',
+                        marker_color='#a0aec0',
+                        texttemplate='%{x:,.0f}',
+                        textposition='outside',
+                        textfont=dict(size=9, color='#718096'),
+                        width=0.35,
+                        offset=-0.18
+                    ),
+                    # Current FY bars (primary color, in front)
+                    go.Bar(
+                        name=current_fy,
+                        y=statuses,
+                        x=current_vals,
+                        orientation='h',
+                        marker_color='#667eea',
+                        texttemplate='%{x:,.0f}',
+                        textposition='outside',
+                        textfont=dict(size=10),
+                        width=0.35,
+                        offset=0.18
+                    )
+                ], layout=plotly_chart_layout(
+                    height=340,
                     title=dict(text='Constant Contact by Status', font=dict(size=14)),
                     xaxis=dict(range=[0, max_val * 1.5]),  # More headroom for labels with % change
                     yaxis=dict(autorange='reversed'),  # Largest at top
                     barmode='group',
                     bargap=0.25,
-                    legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1, font=dict(size=10))
-                )
-
-                # Add % change annotations positioned relative to current FY bar text
-                for i, (val, pct) in enumerate(zip(current_vals, pct_changes)):
-                    color = '#38a169' if pct > 0 else '#e53e3e'
-                    sign = '+' if pct > 0 else ''
-                    fig_cc.add_annotation(
-                        x=val,
-                        y=statuses[i],
-                        text=f'  <b>({sign}{pct:.0f}%)</b>',
-                        showarrow=False,
-                        font=dict(size=10, color=color),
-                        xanchor='left',
-                        yanchor='middle',
-                        xshift=30,  # Shift right past the number text
-                        yshift=-18  # Align with current FY bar
-                    )
+                    legend=dict(font=dict(size=10)),
+                    # % change annotations positioned relative to current FY bar text
+                    annotations=_pct_change_annotations(statuses, current_vals, pct_changes)
+                ))
 
                 st.plotly_chart(fig_cc, use_container_width=True)
+            else:
+                st.info("No Constant Contact campaigns in this period.")
 
     except Exception as e:
         st.warning(f"Unable to load donor contacts data: {e}")
 
 
+# Financial metric card (label, value and an optional gray note line); filled via str.format()
+FINANCIAL_STAT_CARD_HTML = """
+        <div class="metric-card" style="padding: 1rem;">
+            <div style="font-size: 0.85rem; color: #718096; margin-bottom: 0.35rem;">{label}</div>
+            <div style="font-size: 1.75rem; font-weight: 700; color: #1a365d;">{value}</div>
+            <div style="font-size: 0.8rem; color: #718096; margin-top: 0.25rem; min-height: 1rem;">{note}</div>
+        </div>"""
+
+
+def _financial_card_row(cards: list) -> str:
+    """Lay out (label, value, note) financial cards as one three-column HTML row."""
+    cards_html = "".join(
+        FINANCIAL_STAT_CARD_HTML.format(label=label, value=value, note=note)
+        for label, value, note in cards
+    )
+    return f"""
+    <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; margin-bottom: 1.5rem;">{cards_html}
+    </div>
+    """
+
+
 def render_financial_metrics(financial_df: pd.DataFrame = None):
     """Render Financial Metrics section with real data from Google Sheets."""
     fy_info = get_fiscal_year_info(date.today())
@@ -4170,32 +3284,28 @@ def render_financial_metrics(financial_df: pd.DataFrame = None):
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        # Revenue: budget - actual
-        # Positive = below budget (down arrow needed, red - bad)
-        # Negative = above budget (up arrow needed, green - good)
+        # Revenue delta: actual - budget
+        # Negative = below budget (down arrow, red - bad)
+        # Positive = above budget (up arrow, green - good)
         if ytd_revenue_budget > 0:
-            rev_diff = ytd_revenue_budget - ytd_revenue  # positive if under budget
-            rev_pct = (rev_diff / ytd_revenue_budget * 100)
             st.metric(
                 "YTD Revenue",
                 f"${ytd_revenue:,.0f}",
-                delta=f"-${rev_diff:,.0f} ({-rev_pct:.1f}%)" if rev_diff > 0 else f"+${-rev_diff:,.0f} ({-rev_pct:.1f}%)",
+                delta=format_budget_delta(ytd_revenue, ytd_revenue_budget),
                 delta_color="normal"  # negative=red (bad), positive=green (good)
             )
         else:
             st.metric("YTD Revenue", f"${ytd_revenue:,.0f}")
 
     with col2:
-        # Expenses: budget - actual
-        # Positive = under budget (down arrow needed, green - good!)
-        # Negative = over budget (up arrow needed, red - bad!)
+        # Expenses delta: actual - budget
+        # Negative = under budget (down arrow, green - good!)
+        # Positive = over budget (up arrow, red - bad!)
         if ytd_expenses_budget > 0:
-            exp_diff = ytd_expenses_budget - ytd_expenses  # positive if under budget
-            exp_pct = (exp_diff / ytd_expenses_budget * 100)
             st.metric(
                 "YTD Expenses",
                 f"${ytd_expenses:,.0f}",
-                delta=f"-${exp_diff:,.0f} ({-exp_pct:.1f}%)" if exp_diff > 0 else f"+${-exp_diff:,.0f} ({-exp_pct:.1f}%)",
+                delta=format_budget_delta(ytd_expenses, ytd_expenses_budget),
                 delta_color="inverse"
             )
         else:
@@ -4204,65 +3314,41 @@ def render_financial_metrics(financial_df: pd.DataFrame = None):
     with col3:
         # Income: actual - budget (positive diff is good, negative diff is bad)
         if ytd_income_budget != 0:
-            inc_diff = ytd_income - ytd_income_budget
-            inc_pct = (inc_diff / abs(ytd_income_budget) * 100) if ytd_income_budget != 0 else 0
-            # Format with minus sign before $ so Streamlit recognizes negative values
-            if inc_diff >= 0:
-                delta_str = f"+${inc_diff:,.0f} ({inc_pct:.1f}%)"
-            else:
-                delta_str = f"-${abs(inc_diff):,.0f} ({inc_pct:.1f}%)"
             st.metric(
                 "YTD Net Income",
                 f"${ytd_income:,.0f}",
-                delta=delta_str,
+                delta=format_budget_delta(ytd_income, ytd_income_budget),
                 delta_color="normal"  # positive=green (good), negative=red (bad)
             )
         else:
             st.metric("YTD Net Income", f"${ytd_income:,.0f}")
 
-    # Row 2: Budgets
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.metric("Revenue Budget", f"${ytd_revenue_budget:,.0f}")
-
-    with col2:
-        st.metric("Expenses Budget", f"${ytd_expenses_budget:,.0f}")
-
-    with col3:
-        st.metric("Net Income Budget", f"${ytd_income_budget:,.0f}")
-
-    st.markdown("<br>", unsafe_allow_html=True)
+    # Row 2: Budgets (plain values, no delta arrows, so one HTML block instead of three widgets)
+    st.markdown(_financial_card_row([
+        ("Revenue Budget", f"${ytd_revenue_budget:,.0f}", ""),
+        ("Expenses Budget", f"${ytd_expenses_budget:,.0f}", ""),
+        ("Net Income Budget", f"${ytd_income_budget:,.0f}", ""),
+    ]), unsafe_allow_html=True)
 
     # Row 3: Cash, Inventory, Admin Ratio
     st.markdown("##### 💵 Financial Health")
-    col1, col2, col3 = st.columns(3)
 
-    with col1:
-        # Color code months of cash
-        if months_cash_on_hand > 0:
-            cash_status = "🟢" if months_cash_on_hand >= 6 else "🟡" if months_cash_on_hand >= 3 else "🔴"
-            runway_text = f"{months_cash_on_hand:.1f} months runway"
-        else:
-            cash_status = ""
-            runway_text = "Set monthly_expenses_avg to calculate" if total_cash > 0 else None
-        st.metric(
-            f"Total Cash {cash_status}",
-            f"${total_cash:,.0f}",
-            delta=runway_text,
-            delta_color="off"
-        )
+    # Color code months of cash
+    if months_cash_on_hand > 0:
+        cash_status = "🟢" if months_cash_on_hand >= 6 else "🟡" if months_cash_on_hand >= 3 else "🔴"
+        runway_text = f"{months_cash_on_hand:.1f} months runway"
+    else:
+        cash_status = ""
+        runway_text = "Set monthly_expenses_avg to calculate" if total_cash > 0 else ""
 
-    with col2:
-        st.metric("Inventory Value", f"${inventory_value:,.0f}")
+    # Admin % of total - lower is generally better for nonprofits
+    ratio_status = "🟢" if admin_pct_of_total <= 20 else "🟡" if admin_pct_of_total <= 30 else "🔴"
 
-    with col3:
-        # Admin % of total - lower is generally better for nonprofits
-        ratio_status = "🟢" if admin_pct_of_total <= 20 else "🟡" if admin_pct_of_total <= 30 else "🔴"
-        st.metric(
-            f"Admin % of Total Expenses {ratio_status}",
-            f"{admin_pct_of_total:.1f}%"
-        )
+    st.markdown(_financial_card_row([
+        (f"Total Cash {cash_status}", f"${total_cash:,.0f}", runway_text),
+        ("Inventory Value", f"${inventory_value:,.0f}", ""),
+        (f"Admin % of Total Expenses {ratio_status}", f"{admin_pct_of_total:.1f}%", ""),
+    ]), unsafe_allow_html=True)
 
     # Show last updated date
     if 'date' in latest and pd.notna(latest.get('date')):
@@ -4270,6 +3356,94 @@ def render_financial_metrics(financial_df: pd.DataFrame = None):
         st.markdown(f"<p style='color: #94a3b8; font-size: 0.75rem; text-align: right; margin-top: 1rem;'>Financial data as of {last_updated}</p>", unsafe_allow_html=True)
 
 
+# How far ahead Upcoming Events looks
+UPCOMING_EVENTS_WINDOW = relativedelta(months=2)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def prepare_upcoming_events(events_data: list, today_iso: str) -> tuple:
+    """Build the upcoming event cards: valid statuses only, dated within 2 months of today, sorted by date.
+
+    Args:
+        events_data: Raw Fusioo event records
+        today_iso: Today's date (ISO string) - part of the cache key so the window moves daily
+
+    Returns:
+        Tuple of (list of (day, date label, site, program, contact) card tuples, message to show
+        when the list is empty). The list is None when the records have no usable date field.
+    """
+    # Convert to DataFrame
+    df = pd.DataFrame(events_data)
+
+    # Find the date column (decided_date or similar)
+    date_col = None
+    for col in ['decided_date', 'event_date', 'date', 'start_date']:
+        if col in df.columns:
+            date_col = col
+            break
+
+    # Keep only the columns used below so unused Fusioo fields are never processed
+    needed = [c for c in ['status', date_col, *EVENT_CARD_FIELDS] if c in df.columns]
+    df = df[needed]
+
+    # Convert list columns to strings (assign returns a new frame, so the projection is never mutated)
+    df = df.assign(**{col: _flatten_listcol(df[col]) for col in df.select_dtypes(include='object').columns})
+
+    # Filter by status first
+    if "status" in df.columns:
+        df = df.loc[df["status"].isin(VALID_EVENT_STATUSES)]
+
+    if len(df) == 0:
+        return [], "No events with valid status"
+
+    if not date_col:
+        return None, "No date field found in events data"
+
+    # Parse dates - plain ISO dates (the common case) in one formatted pass first
+    raw_dates = df[date_col].where(df[date_col].notna(), '').astype(str).str.strip()
+    event_date = pd.to_datetime(raw_dates, format='%Y-%m-%d', errors='coerce', cache=True)
+    event_end_date = pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+
+    # Only the rest can be date ranges (e.g., "2026-01-15 to 2026-01-17", "date1 - date2" or "date1|date2"):
+    # split those once on the first separator; the end date stays NaT when there is no range
+    needs_split = (event_date.isna() & raw_dates.ne('')).to_numpy()
+    if needs_split.any():
+        date_parts = (
+            raw_dates[needs_split]
+            .str.split(EVENT_DATE_RANGE_SEP, n=1, regex=True, expand=True)
+            .reindex(columns=[0, 1])
+        )
+        event_date[needs_split] = pd.to_datetime(date_parts[0].str.strip(), format='mixed', errors='coerce', cache=True)
+        # Column 1 is all-NaN floats when none of the leftovers is a range
+        if date_parts[1].notna().any():
+            event_end_date[needs_split] = pd.to_datetime(date_parts[1].str.strip(), format='mixed', errors='coerce', cache=True)
+    df = df.assign(_event_date=event_date, _event_end_date=event_end_date)
+
+    # Filter for events within next 2 months (NaT compares False)
+    today = pd.Timestamp(today_iso)
+    window_end = pd.Timestamp(today + UPCOMING_EVENTS_WINDOW)
+    event_dates = df['_event_date'].to_numpy()
+    in_window = (event_dates >= today.to_datetime64()) & (event_dates <= window_end.to_datetime64())
+    upcoming_df = df[in_window].sort_values('_event_date')
+
+    # Format dates for all events at once - show a range when the event ends on a later day
+    starts = upcoming_df['_event_date']
+    ends = upcoming_df['_event_end_date']
+    is_range = (ends.notna() & ends.ne(starts)).to_numpy()
+    event_days = starts.dt.strftime('%a').to_numpy()
+    event_dates = np.where(
+        is_range,
+        starts.dt.strftime('%b %d') + ' - ' + ends.dt.strftime('%b %d'),
+        starts.dt.strftime('%b %d, %Y')
+    )
+
+    # Get event details from Fusioo fields
+    blank = pd.Series('', index=upcoming_df.index)
+    details = [upcoming_df.get(field, blank).fillna('').to_numpy() for field in EVENT_CARD_FIELDS]
+    cards = list(zip(event_days, event_dates, *details))
+    return cards, "No upcoming events in the next 2 months"
+
+
 def render_upcoming_events(events_data: list):
     """Render upcoming events section."""
     st.markdown("""
@@ -4286,130 +3460,89 @@ def render_upcoming_events(events_data: list):
         st.info("No events data available")
         return
 
-    # Convert to DataFrame
-    df = pd.DataFrame(events_data)
+    cards, empty_message = prepare_upcoming_events(events_data, date.today().isoformat())
+    if cards is None:
+        st.warning(empty_message)
+        return
+    if not cards:
+        st.info(empty_message)
+        return
 
-    # Convert list columns to strings
-    for col in df.columns:
-        if df[col].apply(lambda x: isinstance(x, list)).any():
-            df[col] = df[col].apply(
-                lambda x: x[0] if isinstance(x, list) and len(x) == 1
-                else ", ".join(str(i) for i in x) if isinstance(x, list)
-                else x
-            )
+    # Display count
+    st.markdown(f"**{len(cards)} upcoming event{'s' if len(cards) != 1 else ''}**")
+
+    # Display events as compact cards - 2 per row, sent to the browser as one element
+    card_html = []
+    for event_day, event_date, org_site, program, contact in cards:
+        # Build details string
+        details = []
+        if program:
+            details.append(f"🏷️ {program}")
+        if contact:
+            details.append(f"👤 {contact}")
+
+        card_html.append(f"""
+        <div style="display: flex; gap: 0.75rem; padding: 0.875rem; background: linear-gradient(135deg, #fafafa 0%, #f5f5f5 100%); border: 1px solid #e5e7eb; border-radius: 12px; border-left: 4px solid #8b5cf6; height: 100%;">
+            <div style="min-width: 55px; text-align: center;">
+                <div style="font-size: 0.7rem; color: #6b7280; text-transform: uppercase;">{event_day}</div>
+                <div style="font-size: 0.85rem; font-weight: 700; color: #1a202c;">{event_date}</div>
+            </div>
+            <div style="flex: 1; min-width: 0;">
+                <div style="font-weight: 600; color: #1a202c; margin-bottom: 0.25rem; font-size: 0.9rem;">📍 {org_site or 'Event'}</div>
+                <div style="font-size: 0.75rem; color: #6b7280; overflow: hidden; text-overflow: ellipsis;">{' · '.join(details)}</div>
+            </div>
+        </div>""")
 
-    # Filter by status first
-    valid_statuses = ["Date decided", "Ready for Delivery", "Completed"]
-    if "status" in df.columns:
-        status_mask = df["status"].isin(valid_statuses)
-        df = df[status_mask].copy()
+    st.markdown(
+        '<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 0.75rem; margin-bottom: 0.75rem;">'
+        + "".join(card_html) + "</div>",
+        unsafe_allow_html=True
+    )
 
-    if df.empty:
-        st.info("No events with valid status")
-        return
 
-    # Find the date column (decided_date or similar)
-    date_col = None
-    for col in ['decided_date', 'event_date', 'date', 'start_date']:
-        if col in df.columns:
-            date_col = col
-            break
+@st.cache_data(ttl=86400)  # Cache for 24 hours
+def compute_views_trend(views_data: list, time_unit: str, start_date: date = None, end_date: date = None) -> pd.DataFrame:
+    """Aggregate digital/newsletter views per time period for the Engagement trend chart.
 
-    if not date_col:
-        st.warning("No date field found in events data")
-        return
+    Returns:
+        DataFrame with a "period" column plus "Digital Views"/"Newsletter Views";
+        empty when there are no dated views in range.
+    """
+    views_df = pd.DataFrame(views_data)
+    for col in views_df.select_dtypes(include='object').columns:
+        sample = views_df[col].dropna().head(1)
+        if sample.empty or not isinstance(sample.iloc[0], list):
+            continue
+        views_df[col] = _flatten_listcol(views_df[col])
+
+    view_cols = ["total_digital_views", "total_newsletter_views"]
+    available_view_cols = [c for c in view_cols if c in views_df.columns]
+    if "date" not in views_df.columns or not available_view_cols:
+        return pd.DataFrame()
 
-    # Parse dates - handle date ranges (e.g., "2026-01-15 to 2026-01-17" or date range objects)
-    def parse_event_date(date_val):
-        """Parse event date, handling ranges by returning start date."""
-        if pd.isna(date_val):
-            return pd.NaT
-        if isinstance(date_val, str):
-            # Handle range format "date1 to date2" or "date1 - date2"
-            for sep in [' to ', ' - ', '|']:
-                if sep in date_val:
-                    date_val = date_val.split(sep)[0].strip()
-                    break
-        return pd.to_datetime(date_val, errors='coerce')
-
-    def parse_event_end_date(row):
-        """Parse event end date if it's a range."""
-        date_val = row.get(date_col)
-        if pd.isna(date_val):
-            return pd.NaT
-        if isinstance(date_val, str):
-            for sep in [' to ', ' - ', '|']:
-                if sep in date_val:
-                    parts = date_val.split(sep)
-                    if len(parts) > 1:
-                        return pd.to_datetime(parts[1].strip(), errors='coerce')
-        return pd.NaT
-
-    df['_event_date'] = df[date_col].apply(parse_event_date)
-    df['_event_end_date'] = df.apply(parse_event_end_date, axis=1)
-
-    # Filter for events within next 2 months
-    today = pd.Timestamp.now().normalize()
-    two_months_later = today + pd.DateOffset(months=2)
-    upcoming_mask = (df['_event_date'] >= today) & (df['_event_date'] <= two_months_later)
-    upcoming_df = df[upcoming_mask].sort_values('_event_date')
-
-    if upcoming_df.empty:
-        st.info("No upcoming events in the next 2 months")
-        return
+    views = pd.DataFrame(
+        views_df[available_view_cols].apply(pd.to_numeric, errors='coerce').fillna(0).to_numpy(dtype='float64'),
+        columns=available_view_cols,
+        index=_parse_fusioo_dates(views_df["date"])
+    )
+    views = views[views.index.notna()]
+    if start_date and end_date:
+        views = views[_mask_range(views.index.to_series(), start_date, end_date).to_numpy()]
+    if views.empty:
+        return pd.DataFrame()
 
-    # Display count
-    st.markdown(f"**{len(upcoming_df)} upcoming event{'s' if len(upcoming_df) != 1 else ''}**")
-
-    # Display events as compact cards - 2 per row
-    events_list = upcoming_df.to_dict('records')
-    for i in range(0, len(events_list), 2):
-        cols = st.columns(2)
-        for j, col in enumerate(cols):
-            if i + j < len(events_list):
-                event = events_list[i + j]
-                event_dt = pd.to_datetime(event.get('_event_date'))
-                event_end_dt = pd.to_datetime(event.get('_event_end_date')) if pd.notna(event.get('_event_end_date')) else None
-
-                # Format date - show range if end date exists
-                if pd.notna(event_dt):
-                    event_day = event_dt.strftime('%a')
-                    if event_end_dt and pd.notna(event_end_dt) and event_end_dt != event_dt:
-                        # Date range
-                        event_date = f"{event_dt.strftime('%b %d')} - {event_end_dt.strftime('%b %d')}"
-                    else:
-                        event_date = event_dt.strftime('%b %d, %Y')
-                else:
-                    event_day = ''
-                    event_date = 'TBD'
-
-                # Get event details from Fusioo fields
-                org_site = event.get('organizationsite_name_1', '') or 'Event'
-                program = event.get('program', '')
-                contact = event.get('bookspring_contact', '')
-
-                # Build details string
-                details = []
-                if program:
-                    details.append(f"🏷️ {program}")
-                if contact:
-                    details.append(f"👤 {contact}")
-
-                with col:
-                    st.markdown(f"""
-                    <div style="display: flex; gap: 0.75rem; padding: 0.875rem; background: linear-gradient(135deg, #fafafa 0%, #f5f5f5 100%); border: 1px solid #e5e7eb; border-radius: 12px; border-left: 4px solid #8b5cf6; height: 100%; margin-bottom: 0.75rem;">
-                        <div style="min-width: 55px; text-align: center;">
-                            <div style="font-size: 0.7rem; color: #6b7280; text-transform: uppercase;">{event_day}</div>
-                            <div style="font-size: 0.85rem; font-weight: 700; color: #1a202c;">{event_date}</div>
-                        </div>
-                        <div style="flex: 1; min-width: 0;">
-                            <div style="font-weight: 600; color: #1a202c; margin-bottom: 0.25rem; font-size: 0.9rem;">📍 {org_site}</div>
-                            <div style="font-size: 0.75rem; color: #6b7280; overflow: hidden; text-overflow: ellipsis;">{' · '.join(details) if details else ''}</div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+    freq_map = {"day": "D", "week": "W", "month": "ME", "quarter": "QE", "year": "YE"}
+    freq = freq_map.get(time_unit, "ME")
+
+    trend_df = views.sort_index().resample(freq).sum()
+    trend_df.index.name = "period"
+    return trend_df.reset_index().rename(columns={
+        "total_digital_views": "Digital Views",
+        "total_newsletter_views": "Newsletter Views"
+    })
 
 
+@st.fragment
 def render_trends_section(processor: DataProcessor, time_unit: str, views_data: list = None, start_date: date = None, end_date: date = None):
     """Render trends over time section."""
     fy_info = get_fiscal_year_info(date.today())
@@ -4437,64 +3570,32 @@ def render_trends_section(processor: DataProcessor, time_unit: str, views_data:
     category = st.selectbox("Select Metric Category", list(strategic_metrics.keys()), key="trend_category")
 
     if category == "Engagement (Views)" and views_data:
-        views_df = pd.DataFrame(views_data)
-        for col in views_df.columns:
-            if views_df[col].apply(lambda x: isinstance(x, list)).any():
-                views_df[col] = views_df[col].apply(
-                    lambda x: x[0] if isinstance(x, list) and len(x) == 1 else x
-                )
-
-        view_cols = ["total_digital_views", "total_newsletter_views"]
-        available_view_cols = [c for c in view_cols if c in views_df.columns]
-
-        for col in available_view_cols:
-            views_df[col] = pd.to_numeric(views_df[col], errors='coerce').fillna(0)
-
-        if "date" in views_df.columns and available_view_cols:
-            views_df["_parsed_date"] = views_df["date"].apply(
-                lambda x: x.split("|")[0] if isinstance(x, str) and "|" in x else x
-            )
-            views_df["_parsed_date"] = pd.to_datetime(views_df["_parsed_date"], errors='coerce')
-            valid_df = views_df[views_df["_parsed_date"].notna()].copy()
-
-            if start_date and end_date:
-                mask = (valid_df["_parsed_date"] >= pd.Timestamp(start_date)) & (valid_df["_parsed_date"] <= pd.Timestamp(end_date))
-                valid_df = valid_df[mask].copy()
-
-            if not valid_df.empty:
-                freq_map = {"day": "D", "week": "W", "month": "ME", "quarter": "QE", "year": "YE"}
-                freq = freq_map.get(time_unit, "ME")
-
-                trend_df = valid_df.groupby(pd.Grouper(key="_parsed_date", freq=freq))[available_view_cols].sum().reset_index()
-                trend_df = trend_df.rename(columns={
-                    "_parsed_date": "period",
-                    "total_digital_views": "Digital Views",
-                    "total_newsletter_views": "Newsletter Views"
-                })
-
-                display_cols = [c for c in ["Digital Views", "Newsletter Views"] if c in trend_df.columns]
-
-                if display_cols:
-                    fig = px.line(trend_df, x="period", y=display_cols, markers=True,
-                                 color_discrete_sequence=["#f093fb", "#f5576c"])
-                    fig = style_plotly_chart(fig, height=400)
-                    fig.update_layout(xaxis_title=time_unit.title(), yaxis_title="Views")
-                    st.plotly_chart(fig, use_container_width=True)
+        trend_df = compute_views_trend(views_data, time_unit, start_date, end_date)
+        display_cols = [c for c in ["Digital Views", "Newsletter Views"] if c in trend_df.columns]
+
+        if display_cols:
+            fig = px.line(trend_df, x="period", y=display_cols, markers=True,
+                         color_discrete_sequence=_ENGAGEMENT_COLORS)
+            fig.update_layout(**plotly_chart_layout(
+                400, xaxis=dict(title=time_unit.title()), yaxis=dict(title="Views")))
+            st.plotly_chart(fig, use_container_width=True)
     else:
         available_metrics = [m for m in strategic_metrics[category] if m in processor.df.columns]
         if available_metrics:
             time_df = processor.aggregate_by_time(time_unit, available_metrics)
             if not time_df.empty:
-                rename_map = {c: get_friendly_name(c) for c in time_df.columns if c != "period"}
+                friendly = {m: get_friendly_name(m) for m in available_metrics}
+                rename_map = {c: friendly.get(c) or get_friendly_name(c) for c in time_df.columns if c != "period"}
                 display_df = time_df.rename(columns=rename_map)
 
-                fig = px.line(display_df, x="period", y=[get_friendly_name(m) for m in available_metrics],
-                             markers=True, color_discrete_sequence=["#667eea", "#38a169", "#ed8936", "#9f7aea", "#f5576c"])
-                fig = style_plotly_chart(fig, height=400)
-                fig.update_layout(xaxis_title=time_unit.title(), yaxis_title="Value")
+                fig = px.line(display_df, x="period", y=list(friendly.values()),
+                             markers=True, color_discrete_sequence=_TREND_COLORS)
+                fig.update_layout(**plotly_chart_layout(
+                    400, xaxis=dict(title=time_unit.title()), yaxis=dict(title="Value")))
                 st.plotly_chart(fig, use_container_width=True)
 
 
+@st.fragment
 def render_period_comparison(processor: DataProcessor):
     """Render period comparison section."""
     st.markdown("""
@@ -4540,23 +3641,24 @@ def render_period_comparison(processor: DataProcessor):
         comparison_df = processor.compare_periods(p1_start, p1_end, p2_start, p2_end, available_metrics)
 
         if not comparison_df.empty:
-            comparison_df["metric"] = comparison_df["metric"].apply(get_friendly_name)
+            friendly = {m: get_friendly_name(m) for m in available_metrics}
+            comparison_df["metric"] = comparison_df["metric"].map(friendly).fillna(comparison_df["metric"])
 
             col1, col2 = st.columns([1, 1])
 
             with col1:
                 st.markdown("##### Volume Metrics")
-                large_metrics_friendly = [get_friendly_name(m) for m in large_scale_metrics if m in available_metrics]
+                large_metrics_friendly = [friendly[m] for m in large_scale_metrics if m in friendly]
                 large_df = comparison_df[comparison_df["metric"].isin(large_metrics_friendly)]
 
                 if not large_df.empty:
-                    fig = go.Figure(data=[
-                        go.Bar(name="Period 1", x=large_df["metric"], y=large_df["period_1"], marker_color="#667eea"),
-                        go.Bar(name="Period 2", x=large_df["metric"], y=large_df["period_2"], marker_color="#38a169")
-                    ])
-                    fig.update_layout(barmode="group")
-                    fig = style_plotly_chart(fig, height=300)
-                    fig.update_layout(yaxis_title="Count")
+                    fig = go.Figure(
+                        data=[
+                            go.Bar(name="Period 1", x=large_df["metric"], y=large_df["period_1"], marker_color="#667eea"),
+                            go.Bar(name="Period 2", x=large_df["metric"], y=large_df["period_2"], marker_color="#38a169")
+                        ],
+                        layout=plotly_chart_layout(300, barmode="group", yaxis=dict(title="Count"))
+                    )
                     st.plotly_chart(fig, use_container_width=True)
 
             with col2:
@@ -4569,11 +3671,24 @@ def render_period_comparison(processor: DataProcessor):
                     color_continuous_scale=["#f5576c", "#f7fafc", "#38a169"],
                     color_continuous_midpoint=0
                 )
-                fig = style_plotly_chart(fig, height=300)
-                fig.update_layout(showlegend=False, coloraxis_showscale=False, yaxis_title="% Change")
+                fig.update_layout(**plotly_chart_layout(
+                    300, showlegend=False, coloraxis_showscale=False, yaxis=dict(title="% Change")))
                 st.plotly_chart(fig, use_container_width=True)
 
 
+@st.cache_data(ttl=600, show_spinner=False, hash_funcs={DataProcessor: lambda processor: processor.df})
+def build_report_bytes(processor: DataProcessor, time_unit: str) -> bytes:
+    """Generate the standard Excel report and return the workbook bytes.
+
+    Cached per filtered dataset and time unit so repeated clicks reuse the workbook.
+    """
+    # Build the workbook in memory - no need to write it to disk and read it back
+    report_buffer = io.BytesIO()
+    generate_standard_report(processor, report_buffer, time_unit)
+    return report_buffer.getvalue()
+
+
+@st.fragment
 def render_export_section(processor: DataProcessor):
     """Render export section."""
     st.markdown("""
@@ -4600,17 +3715,15 @@ def render_export_section(processor: DataProcessor):
         if st.button("Generate Report", type="primary", use_container_width=True):
             with st.spinner("Generating report..."):
                 try:
-                    output_path = f"reports/{report_filename}"
-                    generate_standard_report(processor, output_path, export_time_unit)
-
-                    with open(output_path, "rb") as f:
-                        st.download_button(
-                            label="Download Excel",
-                            data=f.read(),
-                            file_name=report_filename,
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            use_container_width=True
-                        )
+                    report_bytes = build_report_bytes(processor, export_time_unit)
+
+                    st.download_button(
+                        label="Download Excel",
+                        data=report_bytes,
+                        file_name=report_filename,
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        use_container_width=True
+                    )
                     st.success("Report generated successfully!")
                 except Exception as e:
                     st.error(f"Error generating report: {e}")
@@ -4627,8 +3740,7 @@ def render_debug_avg_books_section(processor: DataProcessor):
             st.warning("No date column found for monthly aggregation")
             return
 
-        df = processor.df.copy()
-        df["_month"] = df[date_col].dt.to_period("M").dt.start_time
+        df = processor.df
 
         # Define age group mappings (same as processor)
         age_groups = {
@@ -4639,31 +3751,34 @@ def render_debug_avg_books_section(processor: DataProcessor):
             "Teens": ["teens"],
         }
 
+        # Sum every needed column per month in a single groupby pass
+        sum_cols = ["_books_distributed_all", "_of_books_distributed", "total_children", "total_children_all"]
+        sum_cols += [col for cols in age_groups.values() for col in cols]
+        sum_cols = [col for col in dict.fromkeys(sum_cols) if col in df.columns]
+        monthly_sums = df[sum_cols].groupby(df[date_col].dt.to_period("M")).sum().to_dict("index")
+
         # Build monthly debug data
         monthly_data = []
 
-        for month, month_df in df.groupby("_month"):
+        for month, sums in monthly_sums.items():
             row = {"Month": month.strftime("%Y-%m")}
 
             # Total books (using _books_distributed_all for total, _of_books_distributed for excl prev served)
-            books_all = month_df["_books_distributed_all"].sum() if "_books_distributed_all" in month_df.columns else 0
-            books_excl = month_df["_of_books_distributed"].sum() if "_of_books_distributed" in month_df.columns else 0
+            books_all = sums.get("_books_distributed_all", 0)
+            books_excl = sums.get("_of_books_distributed", 0)
             row["Books (All)"] = int(books_all)
             row["Books (Excl Prev)"] = int(books_excl)
 
             # Total children - both excluding and including previously served
-            children_total = month_df["total_children"].sum() if "total_children" in month_df.columns else 0
-            children_all = month_df["total_children_all"].sum() if "total_children_all" in month_df.columns else 0
+            children_total = sums.get("total_children", 0)
+            children_all = sums.get("total_children_all", 0)
             row["Children (Excl)"] = int(children_total)
             row["Children (All)"] = int(children_all)
 
             # Children by age group (sum of available columns)
             total_from_age = 0
             for age_name, cols in age_groups.items():
-                age_sum = 0
-                for col in cols:
-                    if col in month_df.columns:
-                        age_sum += month_df[col].sum()
+                age_sum = sum(sums.get(col, 0) for col in cols)
                 row[f"Children {age_name}"] = int(age_sum)
                 total_from_age += age_sum
 
@@ -4698,10 +3813,7 @@ def render_debug_avg_books_section(processor: DataProcessor):
 
             # Per age group averages (books_excl / total_from_age where that age exists)
             for age_name, cols in age_groups.items():
-                age_children = 0
-                for col in cols:
-                    if col in month_df.columns:
-                        age_children += month_df[col].sum()
+                age_children = sum(sums.get(col, 0) for col in cols)
                 # For age-specific avg, we use total children from all age cols (same as processor)
                 if total_from_age > 0 and age_children > 0:
                     avg_val = round(books_excl / total_from_age, 2)
@@ -4829,6 +3941,20 @@ def render_debug_avg_books_section(processor: DataProcessor):
         """, unsafe_allow_html=True)
 
 
+def _load_in_parallel(loaders: dict, max_workers: int = 8) -> dict:
+    """Run independent zero-argument loaders concurrently and return their results by name.
+
+    The loaders are I/O-bound API calls, so threads overlap their network waits.
+    Worker threads are attached to the current script run so st.cache_data and
+    st.error keep working inside the loaders.
+    """
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=max_workers, initializer=add_script_run_ctx,
+                            initargs=(None, ctx)) as executor:
+        futures = {name: executor.submit(loader) for name, loader in loaders.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
 def main():
     """Main dashboard function."""
     # Sidebar
@@ -4878,6 +4004,8 @@ def main():
             load_activity_data.clear()
             load_original_books.clear()
             load_content_views.clear()
+            load_inventory_data.clear()
+            load_donated_books_count.clear()
             st.toast("Fetching fresh data from Fusioo...", icon="🔄")
             st.rerun()
 
@@ -4900,14 +4028,25 @@ def main():
 
     # Load data
     with st.spinner("Loading data..."):
-        activity_records = load_activity_data()
-        legacy_records = load_legacy_data()
-        original_books = load_original_books()
-        content_views = load_content_views()
-        financial_data = load_financial_data()
-        enrollment_count, b3_low_income_pct = load_b3_low_income_stats()
-        events_data = load_events_data()
-        partners_data = load_partners_data()
+        # Independent API calls - fetched concurrently on a cold cache
+        data = _load_in_parallel({
+            "activity": load_activity_data,
+            "legacy": load_legacy_data,
+            "original_books": load_original_books,
+            "content_views": load_content_views,
+            "financial": load_financial_data,
+            "b3_stats": load_b3_low_income_stats,
+            "events": load_events_data,
+            "partners": load_partners_data,
+        })
+        activity_records = data["activity"]
+        legacy_records = data["legacy"]
+        original_books = data["original_books"]
+        content_views = data["content_views"]
+        financial_data = data["financial"]
+        enrollment_count, b3_low_income_pct = data["b3_stats"]
+        events_data = data["events"]
+        partners_data = data["partners"]
 
     # Combine current and legacy activity data
     legacy_count = 0
@@ -5019,8 +4158,7 @@ def main():
     if "activity_type" in processor.df.columns:
         # Check if activity_type contains either value (handles both single values and comma-separated lists)
         event_mask = processor.df["activity_type"].apply(
-            lambda x: "Literacy Materials Distribution" in str(x) or "Family Literacy Activity" in str(x)
-            if pd.notna(x) else False
+            lambda x: bool(_INPERSON_RE.search(str(x))) if pd.notna(x) else False
         )
         inperson_events = int(event_mask.sum())
 
@@ -3,6 +3,7 @@ import pandas as pd
 from datetime import datetime, date
 from typing import Optional, Literal
 from dateutil.relativedelta import relativedelta
+from functools import lru_cache
 
 
 TimeUnit = Literal["day", "week", "month", "quarter", "year", "fiscal_year"]
@@ -28,6 +29,14 @@ class DataProcessor:
         "parents_or_caregivers",
     ]
 
+    # Low-cardinality text columns stored as categoricals (cheap isin/groupby, less memory)
+    CATEGORY_COLUMNS = [
+        "program",
+        "activity_type",
+        "organizationsite_name_1",
+        "bookspring_contact",
+    ]
+
     def __init__(self, records: list):
         self.df = self._records_to_dataframe(records)
         self._exclude_previously_served_children()
@@ -80,6 +89,10 @@ class DataProcessor:
             if col in df.columns:
                 df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
 
+        for col in self.CATEGORY_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+
         return df
 
     def _exclude_previously_served_children(self):
@@ -221,7 +234,8 @@ class DataProcessor:
 
     def _add_time_period_column(self, time_unit: TimeUnit) -> pd.DataFrame:
         """Add a time period column for grouping."""
-        df = self.df.copy()
+        # Shallow copy: only new columns are added, existing buffers are shared, not duplicated
+        df = self.df.copy(deep=False)
         date_col = self.get_date_column()
 
         if time_unit == "day":
@@ -235,9 +249,10 @@ class DataProcessor:
         elif time_unit == "year":
             df["period"] = df[date_col].dt.year
         elif time_unit == "fiscal_year":
-            df["period"] = df[date_col].apply(
-                lambda x: f"FY{self._get_fiscal_year(x)}" if pd.notna(x) else None
-            )
+            # Same rule as _get_fiscal_year, applied to the whole column at once
+            dates = df[date_col]
+            fiscal_year = dates.dt.year + (dates.dt.month >= self.FISCAL_YEAR_START_MONTH)
+            df["period"] = ("FY" + fiscal_year.astype("Int64").astype(str)).where(dates.notna())
 
         return df
 
@@ -411,7 +426,7 @@ class DataProcessor:
         agg_dict = {col: "sum" for col in metrics if col in self.df.columns}
         agg_dict["record_id"] = "count"
 
-        result = self.df.groupby(category_col, dropna=True).agg(agg_dict).reset_index()
+        result = self.df.groupby(category_col, dropna=True, observed=True).agg(agg_dict).reset_index()
         result = result.rename(columns={"record_id": "activity_count"})
 
         return result
@@ -420,40 +435,44 @@ class DataProcessor:
                         period2_start: date, period2_end: date,
                         metrics: Optional[list] = None) -> pd.DataFrame:
         """Compare metrics between two time periods."""
-        p1 = self.filter_by_date_range(period1_start, period1_end)
-        p2 = self.filter_by_date_range(period2_start, period2_end)
-
         if metrics is None:
             metrics = self._get_numeric_columns()
 
+        # Project the needed columns once; books and children feed the weighted ratio metrics
+        needed = dict.fromkeys([*metrics, "_of_books_distributed", "total_children"])
+        projected = self.df[[col for col in needed if col in self.df.columns]]
+
+        # Build both period masks on the date column (no date column: every row is in both periods)
+        date_col = self.get_date_column()
+        period_sums = []
+        for period_start, period_end in ((period1_start, period1_end), (period2_start, period2_end)):
+            if date_col:
+                mask = self.df[date_col].between(pd.Timestamp(period_start), pd.Timestamp(period_end))
+                period_sums.append(projected[mask.to_numpy()].sum())
+            else:
+                period_sums.append(projected.sum())
+        p1_sums, p2_sums = period_sums
+
         # Calculate totals for each period
         p1_totals = {}
         p2_totals = {}
 
         # Get total books and children for weighted average calculation
-        p1_books = p1.df["_of_books_distributed"].sum() if "_of_books_distributed" in p1.df.columns else 0
-        p1_children = p1.df["total_children"].sum() if "total_children" in p1.df.columns else 0
-        p2_books = p2.df["_of_books_distributed"].sum() if "_of_books_distributed" in p2.df.columns else 0
-        p2_children = p2.df["total_children"].sum() if "total_children" in p2.df.columns else 0
+        p1_books = p1_sums.get("_of_books_distributed", 0)
+        p1_children = p1_sums.get("total_children", 0)
+        p2_books = p2_sums.get("_of_books_distributed", 0)
+        p2_children = p2_sums.get("total_children", 0)
 
         for col in metrics:
-            if col in p1.df.columns:
-                if col == "avg_books_per_child":
-                    # Calculate weighted average: total books / total children
-                    p1_totals[col] = p1_books / p1_children if p1_children > 0 else 0
-                elif col in self.RATIO_METRICS:
-                    # For other ratio metrics, use weighted calculation too
-                    p1_totals[col] = p1_books / p1_children if p1_children > 0 else 0
-                else:
-                    p1_totals[col] = p1.df[col].sum()
-
-            if col in p2.df.columns:
-                if col == "avg_books_per_child":
-                    p2_totals[col] = p2_books / p2_children if p2_children > 0 else 0
-                elif col in self.RATIO_METRICS:
-                    p2_totals[col] = p2_books / p2_children if p2_children > 0 else 0
-                else:
-                    p2_totals[col] = p2.df[col].sum()
+            if col not in projected.columns:
+                continue
+            if col in self.RATIO_METRICS:
+                # Ratio metrics (incl. avg_books_per_child) use the weighted average: total books / total children
+                p1_totals[col] = p1_books / p1_children if p1_children > 0 else 0
+                p2_totals[col] = p2_books / p2_children if p2_children > 0 else 0
+            else:
+                p1_totals[col] = p1_sums[col]
+                p2_totals[col] = p2_sums[col]
 
         comparison = []
         for metric in metrics:
@@ -519,6 +538,7 @@ FIELD_LABELS = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_friendly_name(field_id: str) -> str:
     """Get a friendly display name for a field ID."""
     return FIELD_LABELS.get(field_id, field_id.replace("_", " ").title())
@@ -2,7 +2,7 @@
 import pandas as pd
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 from openpyxl import Workbook
 from openpyxl.chart import LineChart, BarChart, PieChart, Reference
 from openpyxl.chart.label import DataLabelList
@@ -224,16 +224,20 @@ class ExcelReportGenerator:
         ws.column_dimensions["A"].width = 30
         ws.column_dimensions["B"].width = 20
 
-    def save(self, filepath: str):
-        """Save the workbook to a file."""
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    def save(self, filepath: Union[str, Path, BinaryIO]):
+        """Save the workbook to a file path or a binary file-like object (e.g. io.BytesIO)."""
+        if isinstance(filepath, (str, Path)):
+            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         self.wb.save(filepath)
         return filepath
 
 
-def generate_standard_report(processor: DataProcessor, output_path: str,
-                             time_unit: TimeUnit = "month") -> str:
-    """Generate a standard BookSpring report with common metrics."""
+def generate_standard_report(processor: DataProcessor, output_path: Union[str, BinaryIO],
+                             time_unit: TimeUnit = "month") -> Union[str, BinaryIO]:
+    """Generate a standard BookSpring report with common metrics.
+
+    output_path may be a file path or a binary file-like object such as io.BytesIO.
+    """
     metrics = [
         "_of_books_distributed",
         "total_children",
@@ -0,0 +1,30 @@
+"""Tests for filtering activity records by date range."""
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("streamlit")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.dashboard.app import _filter_records_by_date  # noqa: E402
+
+
+def test_mixed_formats_and_list_dates_are_kept():
+    records = [
+        {"date_of_activity": "2025-08-01"},
+        {"date_of_activity": "08/05/2025"},
+        {"date_of_activity": ["2025-08-02"]},
+        {"date": "2025-08-03"},
+        {"date_of_activity": "2024-01-01"},
+        {"date_of_activity": None},
+        {"date_of_activity": "not a date"},
+        {"date_of_activity": ["2025-08-02", "2025-08-04"]},
+    ]
+
+    kept = _filter_records_by_date(records, date(2025, 8, 1), date(2025, 8, 31))
+
+    assert kept == records[:4]
@@ -0,0 +1,94 @@
+"""Tests for the Upcoming Events card preparation."""
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("streamlit")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.dashboard.app import prepare_upcoming_events  # noqa: E402
+
+TODAY = "2026-11-01"
+
+
+def _event(date_value, status="Date decided", site="Site"):
+    return {
+        "decided_date": date_value,
+        "status": status,
+        "organizationsite_name_1": site,
+        "program": "Program",
+        "bookspring_contact": "Contact",
+    }
+
+
+def test_blank_and_missing_dates_are_skipped():
+    events = [
+        _event("2026-11-05", site="dated"),
+        _event("", site="blank"),
+        _event(None, site="none"),
+    ]
+
+    cards, _ = prepare_upcoming_events(events, TODAY)
+
+    assert [card[2] for card in cards] == ["dated"]
+
+
+def test_list_valued_cells_are_flattened():
+    event = _event(["2026-11-05"], status=["Date decided"], site=["Library"])
+    event["bookspring_contact"] = ["Ana", "Ben"]
+
+    cards, _ = prepare_upcoming_events([event], TODAY)
+
+    assert cards == [("Thu", "Nov 05, 2026", "Library", "Program", "Ana, Ben")]
+
+
+def test_records_without_a_date_column():
+    event = _event("2026-11-05")
+    del event["decided_date"]
+
+    cards, message = prepare_upcoming_events([event], TODAY)
+
+    assert cards is None
+    assert message == "No date field found in events data"
+
+
+def test_mixed_date_formats_and_ranges_are_all_parsed():
+    events = [
+        _event("11/05/2026", site="slash"),
+        _event("Nov 10, 2026", site="written"),
+        _event("2026-11-03 to 2026-11-05", site="to range"),
+        _event("2026-11-20T10:00:00", site="timestamp"),
+        _event("2026-11-21|2026-11-22", site="pipe range"),
+        _event("12/01/2026 - 12/03/2026", site="dash range"),
+        _event("2026-11-12", site="iso"),
+    ]
+
+    cards, _ = prepare_upcoming_events(events, TODAY)
+
+    assert [(card[2], card[1]) for card in cards] == [
+        ("to range", "Nov 03 - Nov 05"),
+        ("slash", "Nov 05, 2026"),
+        ("written", "Nov 10, 2026"),
+        ("iso", "Nov 12, 2026"),
+        ("timestamp", "Nov 20, 2026"),
+        ("pipe range", "Nov 21 - Nov 22"),
+        ("dash range", "Dec 01 - Dec 03"),
+    ]
+
+
+def test_non_iso_dates_without_any_range():
+    events = [
+        _event("11/05/2026", site="slash"),
+        _event("", site="blank"),
+        _event("Nov 3, 2026", site="written"),
+    ]
+
+    cards, _ = prepare_upcoming_events(events, TODAY)
+
+    assert [(card[2], card[1]) for card in cards] == [
+        ("written", "Nov 03, 2026"),
+        ("slash", "Nov 05, 2026"),
+    ]